@@ -64,6 +64,7 @@ def create_spec_file(
         'asyncio',
         'psutil',
         'screeninfo',
+        'mss',
         'telegram',
         'telegram.ext',
         'pynput',
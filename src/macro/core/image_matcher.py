@@ -3,10 +3,34 @@
 """
 
 import cv2
+import logging
 import numpy as np
+from collections import OrderedDict
 from typing import Tuple, Optional, Dict, Any
 from pathlib import Path
-from functools import reduce
+
+logger = logging.getLogger(__name__)
+
+
+# TM_SQDIFF 계열은 최소값이 최적 매치
+SQDIFF_METHODS = frozenset({cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED})
+# 피라미드 매칭 최대 단계 (단계마다 가로/세로 1/2 축소)
+PYRAMID_MAX_LEVELS = 2
+# 축소된 템플릿의 짧은 변이 이 크기 이상일 때만 해당 단계까지 축소
+PYRAMID_MIN_TEMPLATE_SIDE = 16
+# 재사용할 매칭 결과 버퍼 최대 개수 (크기별 1개)
+MAX_RESULT_BUFFERS = 8
+# 템플릿 캐시 한도 (가장 오래 사용하지 않은 템플릿부터 제거)
+MAX_CACHED_TEMPLATES = 64
+MAX_TEMPLATE_CACHE_BYTES = 128 * 1024 * 1024
+
+
+def _cuda_device_available() -> bool:
+    """OpenCV가 CUDA로 빌드되었고 사용 가능한 GPU가 있는지 확인"""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
 
 
 class MatchResult:
@@ -20,6 +44,7 @@ class MatchResult:
         top_left: Optional[Tuple[int, int]] = None,
         bottom_right: Optional[Tuple[int, int]] = None,
         template_size: Optional[Tuple[int, int]] = None,
+        click_position: Optional[Tuple[int, int]] = None,
     ):
         self.found = found
         self.confidence = confidence
@@ -27,46 +52,123 @@ class MatchResult:
         self.top_left = top_left
         self.bottom_right = bottom_right
         self.template_size = template_size
+        # 매칭 시작점 + click_offset (click_offset을 지정한 경우만)
+        self.click_position = click_position
 
 
 class ImageMatcher:
     """OpenCV 기반 이미지 매칭 엔진"""
 
     def __init__(self):
-        self.template_cache: Dict[str, np.ndarray] = {}
+        # 템플릿 캐시 (최근 사용 순서 유지, 개수/메모리 한도 초과 시 제거)
+        self.template_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._template_cache_bytes = 0
+        # 미리 로드할 때 확인한 템플릿 파일 수정 시각 (경로 -> st_mtime_ns)
+        self._template_mtimes: Dict[str, int] = {}
+        # 선택 영역으로 잘라낸 템플릿 캐시 ((경로, 영역) -> 연속 메모리 배열)
+        self.region_template_cache: Dict[
+            Tuple[str, Tuple[int, int, int, int]], np.ndarray
+        ] = {}
+        # matchTemplate 결과 버퍼 ((높이, 너비) -> float32 배열), 폴링마다 재할당 방지
+        self._result_buffers: Dict[Tuple[int, int], np.ndarray] = {}
+        # 템플릿을 흑백으로 로드할지 여부 (스크린샷도 흑백으로 캡쳐해야 함)
+        self.grayscale = False
+
+        # CUDA 매칭 (GPU가 있으면 사용, 업로드용 GpuMat은 재사용)
+        self.use_cuda = _cuda_device_available()
+        self._cuda_matchers: Dict[Tuple[int, int], Any] = {}
+        if self.use_cuda:
+            self._gpu_image = cv2.cuda_GpuMat()
+            self._gpu_template = cv2.cuda_GpuMat()
+            logger.info("[Image Matcher] CUDA 템플릿 매칭 사용")
+
+        # OpenCL(T-API) 매칭 (설정으로 켜며 CUDA가 없을 때만 사용)
+        self.use_opencl = False
+
+    def set_use_opencl(self, enabled: bool) -> None:
+        """OpenCL 매칭 사용 여부 설정 (OpenCL을 쓸 수 없는 환경이면 무시)"""
+        self.use_opencl = enabled and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        elif enabled:
+            logger.warning("[Image Matcher] OpenCL을 사용할 수 없어 CPU로 매칭합니다")
+
+    def set_grayscale(self, grayscale: bool) -> None:
+        """흑백 매칭 여부 설정 (바뀌면 다른 형식으로 로드된 캐시를 비움)"""
+        if grayscale != self.grayscale:
+            self.clear_cache()
+            self.grayscale = grayscale
 
     def load_template(self, template_path: str) -> Optional[np.ndarray]:
         """템플릿 이미지 로드"""
         try:
-            if template_path in self.template_cache:
-                return self.template_cache[template_path]
-
-            template_path_obj = Path(template_path)
-            if not template_path_obj.exists():
-                print(
-                    f"[Image Matcher] 템플릿 파일이 존재하지 않습니다: {template_path}"
-                )
-                return None
-
-            # Windows에서 한글 파일명 문제 해결을 위한 여러 방법 시도
-            template = None
-
-            template = cv2.imread(str(template_path_obj))
+            cached = self.template_cache.get(template_path)
+            if cached is not None:
+                self.template_cache.move_to_end(template_path)
+                return cached
+
+            # 파일이 없으면 imread가 None을 반환하므로 별도 exists() 확인 생략
+            template = cv2.imread(
+                str(Path(template_path)),
+                cv2.IMREAD_GRAYSCALE if self.grayscale else cv2.IMREAD_COLOR,
+            )
 
             if template is None:
-                print(f"[Image Matcher] 템플릿 이미지 로드 실패: {template_path}")
+                logger.warning(
+                    "[Image Matcher] 템플릿 이미지 로드 실패 (파일 없음 또는 손상): %s",
+                    template_path,
+                )
                 return None
 
             self.template_cache[template_path] = template
-            print(
-                f"[Image Matcher] 템플릿 로드 완료: {template_path}, 크기: {template.shape}"
+            self._template_cache_bytes += template.nbytes
+            self._evict_templates()
+            logger.debug(
+                "[Image Matcher] 템플릿 로드 완료: %s, 크기: %s",
+                template_path,
+                template.shape,
             )
             return template
 
         except Exception as e:
-            print(f"[Image Matcher] 템플릿 로드 중 오류: {template_path}, {e}")
+            logger.error(
+                "[Image Matcher] 템플릿 로드 중 오류: %s, %s", template_path, e
+            )
             return None
 
+    def preload_template(self, template_path: str) -> bool:
+        """실행 전 템플릿을 미리 로드 (마지막 확인 이후 파일이 바뀌었으면 다시 로드)"""
+        try:
+            mtime = Path(template_path).stat().st_mtime_ns
+        except OSError:
+            return False
+
+        if (
+            template_path in self.template_cache
+            and self._template_mtimes.get(template_path) != mtime
+        ):
+            self._discard_template(template_path)
+
+        self._template_mtimes[template_path] = mtime
+        return self.load_template(template_path) is not None
+
+    def _evict_templates(self) -> None:
+        """캐시 한도를 넘으면 가장 오래 사용하지 않은 템플릿부터 제거"""
+        while len(self.template_cache) > 1 and (
+            len(self.template_cache) > MAX_CACHED_TEMPLATES
+            or self._template_cache_bytes > MAX_TEMPLATE_CACHE_BYTES
+        ):
+            self._discard_template(next(iter(self.template_cache)))
+
+    def _discard_template(self, template_path: str) -> None:
+        """캐시에서 템플릿과 그 템플릿에서 잘라낸 영역 캐시 제거"""
+        template = self.template_cache.pop(template_path)
+        self._template_cache_bytes -= template.nbytes
+        self._template_mtimes.pop(template_path, None)
+
+        for key in [k for k in self.region_template_cache if k[0] == template_path]:
+            del self.region_template_cache[key]
+
     def match_template(
         self,
         screenshot: np.ndarray,
@@ -74,32 +176,19 @@ class ImageMatcher:
         threshold: float = 0.8,
         method: int = cv2.TM_CCOEFF_NORMED,
     ) -> MatchResult:
-        print("Start match_template")
-
-
         """템플릿 매칭 수행"""
         try:
-
-            # 템플릿 매칭 수행
-            result = cv2.matchTemplate(screenshot, template, method)
-
-            # 최적 매칭 위치 찾기
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-
-            # TM_SQDIFF 계열은 최소값이 최적 매치
-            if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]:
-                match_confidence = 1.0 - min_val
-                match_location = min_loc
-            else:
-                match_confidence = max_val
-                match_location = max_loc
+            # 템플릿 매칭 수행 (큰 템플릿은 축소 이미지에서 먼저 위치를 좁힘)
+            match_confidence, match_location = self._match_pyramid(
+                screenshot, template, method, threshold
+            )
 
             # 매칭 성공 여부 판단
             found = match_confidence >= threshold
 
             if found:
                 # 템플릿 크기
-                template_h, template_w, _ = template.shape
+                template_h, template_w = template.shape[:2]
 
                 # 매칭된 영역의 좌표 계산
                 top_left = match_location
@@ -109,9 +198,12 @@ class ImageMatcher:
                     top_left[1] + template_h // 2,
                 )
 
-                print(
-                    f"이미지 매칭 성공 - 신뢰도: {match_confidence:.3f}, "
-                    f"중심: {center_position}, 영역: {top_left} ~ {bottom_right}"
+                logger.debug(
+                    "이미지 매칭 성공 - 신뢰도: %.3f, 중심: %s, 영역: %s ~ %s",
+                    match_confidence,
+                    center_position,
+                    top_left,
+                    bottom_right,
                 )
 
                 return MatchResult(
@@ -123,39 +215,151 @@ class ImageMatcher:
                     template_size=(template_w, template_h),
                 )
             else:
-                print(
-                    f"이미지 매칭 실패 - 신뢰도: {match_confidence:.3f} < {threshold}"
+                logger.debug(
+                    "이미지 매칭 실패 - 신뢰도: %.3f < %s", match_confidence, threshold
                 )
                 return MatchResult(found=False, confidence=match_confidence)
 
         except Exception as e:
-            print(f"[Image Matcher] 템플릿 매칭 중 오류: {e}")
+            logger.error("[Image Matcher] 템플릿 매칭 중 오류: %s", e)
             return MatchResult(found=False)
 
+    def _match(
+        self, image: np.ndarray, template: np.ndarray, method: int
+    ) -> np.ndarray:
+        """미리 할당한 결과 버퍼에 템플릿 매칭 수행"""
+        if self.use_cuda:
+            try:
+                return self._match_cuda(image, template, method)
+            except cv2.error as e:
+                logger.warning("[Image Matcher] CUDA 매칭 실패, CPU로 전환: %s", e)
+                self.use_cuda = False
+
+        if self.use_opencl:
+            # UMat으로 넘기면 OpenCV가 OpenCL 장치에서 매칭
+            result = cv2.matchTemplate(cv2.UMat(image), cv2.UMat(template), method)
+            return result.get()
+
+        shape = (
+            image.shape[0] - template.shape[0] + 1,
+            image.shape[1] - template.shape[1] + 1,
+        )
+        result = self._result_buffers.get(shape)
+        if result is None:
+            if len(self._result_buffers) >= MAX_RESULT_BUFFERS:
+                self._result_buffers.clear()
+            result = np.empty(shape, dtype=np.float32)
+            self._result_buffers[shape] = result
+        return cv2.matchTemplate(image, template, method, result)
+
+    def _match_cuda(
+        self, image: np.ndarray, template: np.ndarray, method: int
+    ) -> np.ndarray:
+        """GPU에서 템플릿 매칭 수행 (결과 맵만 다운로드)"""
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        matcher = self._cuda_matchers.get((channels, method))
+        if matcher is None:
+            matcher = cv2.cuda.createTemplateMatching(cv2.CV_8UC(channels), method)
+            self._cuda_matchers[(channels, method)] = matcher
+
+        self._gpu_image.upload(image)
+        self._gpu_template.upload(template)
+        return matcher.match(self._gpu_image, self._gpu_template).download()
+
+    def _best_match(
+        self, result: np.ndarray, method: int
+    ) -> Tuple[float, Tuple[int, int]]:
+        """매칭 결과에서 최적 신뢰도와 위치 반환"""
+        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+
+        if method in SQDIFF_METHODS:
+            return 1.0 - min_val, min_loc
+        return max_val, max_loc
+
+    def _match_pyramid(
+        self,
+        screenshot: np.ndarray,
+        template: np.ndarray,
+        method: int,
+        threshold: float,
+    ) -> Tuple[float, Tuple[int, int]]:
+        """축소 이미지에서 대략적인 위치를 찾은 뒤 원본 해상도 주변 영역에서만 정밀 매칭"""
+        template_h, template_w = template.shape[:2]
+        screen_h, screen_w = screenshot.shape[:2]
+
+        # 템플릿이 충분히 클 때만 축소 단계 사용
+        levels = 0
+        min_side = min(template_h, template_w)
+        while (
+            levels < PYRAMID_MAX_LEVELS
+            and min_side >> (levels + 1) >= PYRAMID_MIN_TEMPLATE_SIDE
+        ):
+            levels += 1
+
+        if levels == 0:
+            return self._best_match(self._match(screenshot, template, method), method)
+
+        # 거친 단계 매칭
+        small_screenshot = screenshot
+        small_template = template
+        for _ in range(levels):
+            small_screenshot = cv2.pyrDown(small_screenshot)
+            small_template = cv2.pyrDown(small_template)
+
+        coarse_result = self._match(small_screenshot, small_template, method)
+        _, coarse_location = self._best_match(coarse_result, method)
+
+        # 원본 해상도에서 거친 위치 주변만 정밀 매칭 (축소 템플릿 크기만큼 여유)
+        scale = 1 << levels
+        small_h, small_w = small_template.shape[:2]
+        margin_x = max(small_w, scale * 2)
+        margin_y = max(small_h, scale * 2)
+        x = coarse_location[0] * scale
+        y = coarse_location[1] * scale
+        x0 = max(x - margin_x, 0)
+        y0 = max(y - margin_y, 0)
+        x1 = min(x + template_w + margin_x, screen_w)
+        y1 = min(y + template_h + margin_y, screen_h)
+
+        fine_result = self._match(screenshot[y0:y1, x0:x1], template, method)
+        confidence, location = self._best_match(fine_result, method)
+        if confidence >= threshold:
+            return confidence, (location[0] + x0, location[1] + y0)
+
+        # 거친 단계가 다른 위치를 골랐을 수 있으므로 원본 전체에서 다시 매칭
+        return self._best_match(self._match(screenshot, template, method), method)
+
     def find_image_in_screenshot(
         self,
         screenshot: np.ndarray,
         template_path: str,
         template_region: Optional[Tuple[int, int, int, int]] = None,
         threshold: float = 0.8,
+        search_region: Optional[Tuple[int, int, int, int]] = None,
+        click_offset: Optional[Tuple[int, int]] = None,
     ) -> MatchResult:
-        """스크린샷에서 이미지 찾기"""
+        """스크린샷에서 이미지 찾기 (search_region 지정 시 해당 화면 영역만 검색)"""
         try:
             # 템플릿 로드
             template = self.load_template(template_path)
             if template is None:
                 return MatchResult(found=False)
 
-            # 검색 영역 제한
+            # 검색 영역 제한 (복사 없이 화면 일부만 잘라서 매칭)
             search_area = screenshot
             offset_x, offset_y = 0, 0
 
+            if search_region:
+                x1, y1, x2, y2 = search_region
+                search_area = screenshot[y1:y2, x1:x2]
+                offset_x, offset_y = x1, y1
+
             if template_region:
-                template = template[
-                    template_region[1] : template_region[3],
-                    template_region[0] : template_region[2],
-                ]
-                offset_x, offset_y = template_region[0], template_region[1]
+                template = self._get_region_template(
+                    template_path, template, template_region
+                )
+                offset_x += template_region[0]
+                offset_y += template_region[1]
 
             # 이미지 매칭 수행
             result = self.match_template(search_area, template, threshold)
@@ -175,20 +379,50 @@ class ImageMatcher:
                     result.bottom_right[1] + offset_y,
                 )
 
+            # 매칭 시작점 기준 클릭 좌표 계산
+            if result.found and click_offset:
+                result.click_position = (
+                    result.top_left[0] + click_offset[0],
+                    result.top_left[1] + click_offset[1],
+                )
+
             return result
 
         except Exception as e:
-            print(f"[Image Matcher] 이미지 검색 중 오류: {template_path}, {e}")
+            logger.error(
+                "[Image Matcher] 이미지 검색 중 오류: %s, %s", template_path, e
+            )
             return MatchResult(found=False)
 
+    def _get_region_template(
+        self,
+        template_path: str,
+        template: np.ndarray,
+        template_region: Tuple[int, int, int, int],
+    ) -> np.ndarray:
+        """선택 영역으로 잘라낸 템플릿 반환 (매 호출마다 복사하지 않도록 캐시)"""
+        key = (template_path, tuple(template_region))
+        region_template = self.region_template_cache.get(key)
+        if region_template is None:
+            x1, y1, x2, y2 = template_region
+            region_template = np.ascontiguousarray(template[y1:y2, x1:x2])
+            self.region_template_cache[key] = region_template
+        return region_template
+
     def clear_cache(self) -> None:
         """템플릿 캐시 삭제"""
         self.template_cache.clear()
-        print("템플릿 캐시 삭제됨")
+        self._template_cache_bytes = 0
+        self._template_mtimes.clear()
+        self.region_template_cache.clear()
+        self._result_buffers.clear()
+        logger.debug("템플릿 캐시 삭제됨")
 
     def get_cache_info(self) -> Dict[str, Any]:
         """캐시 정보 반환"""
         return {
             "cached_templates": len(self.template_cache),
+            "cached_template_bytes": self._template_cache_bytes,
+            "cached_region_templates": len(self.region_template_cache),
             "template_paths": list(self.template_cache.keys()),
         }
@@ -3,22 +3,36 @@
 """
 
 import pyautogui
+import ctypes
 import time
 import logging
 from typing import List, Optional, Tuple
 import platform
+import re
+import threading
 import pyperclip
 
 logger = logging.getLogger(__name__)
 
+# 한글 음절 범위 (가 ~ 힣)
+HANGUL_PATTERN = re.compile("[가-힣]")
+# direct_type_ascii 사용 시 이 길이 이하의 ASCII 텍스트는 클립보드 없이 직접 입력
+DIRECT_TYPE_MAX_LENGTH = 20
+# 붙여넣기 후 원래 클립보드를 복원하기 전 대기 시간 (초, 백그라운드에서 대기)
+CLIPBOARD_RESTORE_DELAY = 1.0
+
 
 class InputController:
     """마우스/키보드 입력 제어 클래스"""
 
+    # 디스플레이 스케일 팩터 (프로세스당 한 번만 계산)
+    _cached_scale_factor: Optional[float] = None
+
     def __init__(self):
         # PyAutoGUI 설정
         pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.1
+        # 동작 사이 간격은 default_delay/click_delay로 제어 (PyAutoGUI 자동 대기 비활성화)
+        pyautogui.PAUSE = 0
 
         self.platform = platform.system().lower()
 
@@ -30,13 +44,35 @@ class InputController:
         # 마우스 이동 설정
         self.mouse_move_duration = 0
 
-        # 좌표 스케일링 팩터 (HiDPI 대응)
-        self.scale_factor = self._get_display_scale_factor()
+        # 짧은 ASCII 텍스트를 키 입력으로 직접 입력할지 여부
+        # (한글 IME가 한글 모드이거나 US 자판이 아니면 잘못 입력되므로 기본 비활성)
+        self.direct_type_ascii = False
+
+        # 붙여넣기 후 클립보드 복원 상태 (대기 중인 복원 타이머, 복원할 내용)
+        self._clipboard_lock = threading.Lock()
+        self._clipboard_restore: Optional[threading.Timer] = None
+        self._saved_clipboard: Optional[str] = None
+
+        # 좌표 스케일링 팩터 (HiDPI 대응, 처음 사용할 때 계산)
+        self._scale_factor: Optional[float] = None
 
-        print(f"Display scale factor: {self.scale_factor}")
+    @property
+    def scale_factor(self) -> float:
+        """디스플레이 스케일 팩터 (HiDPI 대응)"""
+        if self._scale_factor is None:
+            self._scale_factor = self._get_display_scale_factor()
+            logger.debug("Display scale factor: %s", self._scale_factor)
+        return self._scale_factor
+
+    @scale_factor.setter
+    def scale_factor(self, value: float):
+        self._scale_factor = value
 
     def _get_display_scale_factor(self) -> float:
-        """디스플레이 스케일 팩터 계산"""
+        """디스플레이 스케일 팩터 계산 (전체 화면 캡쳐가 필요하므로 결과를 캐시)"""
+        if InputController._cached_scale_factor is not None:
+            return InputController._cached_scale_factor
+
         try:
             # PyAutoGUI의 화면 크기와 실제 스크린샷 크기 비교
             screen_size = pyautogui.size()
@@ -49,14 +85,18 @@ class InputController:
             # 일반적으로 x, y 스케일이 같으므로 x 스케일 사용
             scale_factor = scale_x
 
-            print(
-                f"Screen size: {screen_size}, Screenshot size: {screenshot.size}, Scale: {scale_factor}"
+            logger.debug(
+                "Screen size: %s, Screenshot size: %s, Scale: %s",
+                screen_size,
+                screenshot.size,
+                scale_factor,
             )
 
+            InputController._cached_scale_factor = scale_factor
             return scale_factor
 
         except Exception as e:
-            print(f"스케일 팩터 계산 실패: {e}")
+            logger.error("스케일 팩터 계산 실패: %s", e)
             return 1.0  # 기본값
 
     def _adjust_coordinates(self, x: int, y: int) -> Tuple[int, int]:
@@ -64,8 +104,13 @@ class InputController:
         if self.scale_factor != 1.0:
             adjusted_x = int(x / self.scale_factor)
             adjusted_y = int(y / self.scale_factor)
-            print(
-                f"좌표 보정: ({x}, {y}) -> ({adjusted_x}, {adjusted_y}) (scale: {self.scale_factor})"
+            logger.debug(
+                "좌표 보정: (%s, %s) -> (%s, %s) (scale: %s)",
+                x,
+                y,
+                adjusted_x,
+                adjusted_y,
+                self.scale_factor,
             )
             return adjusted_x, adjusted_y
         return x, y
@@ -92,8 +137,12 @@ class InputController:
             pyautogui.moveTo(x, y, duration=self.mouse_move_duration)
             time.sleep(self.click_delay)
 
-            print(
-                f"마우스 클릭 (보정된 좌표): 버튼={button}, 횟수={clicks}, 위치=({x}, {y})"
+            logger.debug(
+                "마우스 클릭 (보정된 좌표): 버튼=%s, 횟수=%s, 위치=(%s, %s)",
+                button,
+                clicks,
+                x,
+                y,
             )
             pyautogui.click(
                 x=x,
@@ -107,8 +156,7 @@ class InputController:
             return True
 
         except Exception as e:
-            print(f"마우스 클릭 실패 (보정된 좌표): {e}")
-            logger.error(f"마우스 클릭 실패: {e}")
+            logger.error("마우스 클릭 실패 (보정된 좌표): %s", e)
             return False
 
     def move_mouse(
@@ -123,14 +171,22 @@ class InputController:
                 duration = self.mouse_move_duration if smooth else 0
 
             current_x, current_y = pyautogui.position()
-            print(
-                f"마우스 이동: ({current_x}, {current_y}) -> ({adjusted_x}, {adjusted_y}) [원본: ({x}, {y})]"
+            logger.debug(
+                "마우스 이동: (%s, %s) -> (%s, %s) [원본: (%s, %s)]",
+                current_x,
+                current_y,
+                adjusted_x,
+                adjusted_y,
+                x,
+                y,
             )
 
             # 여러 번 시도로 정확도 향상 (macOS 호환성)
             max_attempts = 1
             for attempt in range(max_attempts):
-                pyautogui.moveTo(adjusted_x, adjusted_y, duration=duration)
+                # 즉시 이동은 가능하면 OS API로 직접 처리
+                if duration or not self._native_move(adjusted_x, adjusted_y):
+                    pyautogui.moveTo(adjusted_x, adjusted_y, duration=duration)
 
                 # 이동 확인
                 final_x, final_y = pyautogui.position()
@@ -138,25 +194,48 @@ class InputController:
                 error_y = abs(final_y - adjusted_y)
 
                 if error_x <= 3 and error_y <= 3:  # 3픽셀 오차 허용
-                    print(
-                        f"마우스 이동 성공 ({attempt + 1}번째 시도): ({final_x}, {final_y})"
+                    logger.debug(
+                        "마우스 이동 성공 (%s번째 시도): (%s, %s)",
+                        attempt + 1,
+                        final_x,
+                        final_y,
                     )
                     return True
 
                 if attempt < max_attempts - 1:
-                    print(
-                        f"마우스 이동 재시도 {attempt + 2}/{max_attempts}: 오차 ({error_x}, {error_y})"
+                    logger.debug(
+                        "마우스 이동 재시도 %s/%s: 오차 (%s, %s)",
+                        attempt + 2,
+                        max_attempts,
+                        error_x,
+                        error_y,
                     )
                     duration = 0  # 다음 시도는 즉시 이동
 
             # 모든 시도 실패
-            print(
-                f"마우스 이동 부정확 ({max_attempts}번 시도): 목표({adjusted_x}, {adjusted_y}), 실제({final_x}, {final_y})"
+            logger.warning(
+                "마우스 이동 부정확 (%s번 시도): 목표(%s, %s), 실제(%s, %s)",
+                max_attempts,
+                adjusted_x,
+                adjusted_y,
+                final_x,
+                final_y,
             )
             return False
 
         except Exception as e:
-            print(f"마우스 이동 실패: ({x}, {y}), {e}")
+            logger.error("마우스 이동 실패: (%s, %s), %s", x, y, e)
+            return False
+
+    def _native_move(self, x: int, y: int) -> bool:
+        """OS API로 커서를 즉시 이동 (지원하지 않는 플랫폼이면 False 반환)"""
+        if self.platform != "windows":
+            return False
+
+        try:
+            return bool(ctypes.windll.user32.SetCursorPos(int(x), int(y)))
+        except Exception as e:
+            logger.warning("SetCursorPos 실패, PyAutoGUI로 대체: %s", e)
             return False
 
     def click(
@@ -178,8 +257,14 @@ class InputController:
                     return False
                 time.sleep(self.click_delay)
 
-                print(
-                    f"마우스 클릭: 버튼={button}, 횟수={clicks}, 위치=({adjusted_x}, {adjusted_y}) [원본: ({x}, {y})]"
+                logger.debug(
+                    "마우스 클릭: 버튼=%s, 횟수=%s, 위치=(%s, %s) [원본: (%s, %s)]",
+                    button,
+                    clicks,
+                    adjusted_x,
+                    adjusted_y,
+                    x,
+                    y,
                 )
                 pyautogui.click(
                     x=adjusted_x,
@@ -189,14 +274,14 @@ class InputController:
                     button=button,
                 )
             else:
-                print(f"마우스 클릭: 버튼={button}, 횟수={clicks}, 현재 위치")
+                logger.debug("마우스 클릭: 버튼=%s, 횟수=%s, 현재 위치", button, clicks)
                 pyautogui.click(clicks=clicks, interval=interval, button=button)
 
             time.sleep(self.default_delay)
             return True
 
         except Exception as e:
-            print(f"마우스 클릭 실패: ({x}, {y}), {e}")
+            logger.error("마우스 클릭 실패: (%s, %s), %s", x, y, e)
             return False
 
     def double_click(self, x: Optional[int] = None, y: Optional[int] = None) -> bool:
@@ -210,17 +295,19 @@ class InputController:
                     return False
                 time.sleep(self.click_delay)
 
-                print(f"더블클릭: ({adjusted_x}, {adjusted_y}) [원본: ({x}, {y})]")
+                logger.debug(
+                    "더블클릭: (%s, %s) [원본: (%s, %s)]", adjusted_x, adjusted_y, x, y
+                )
                 pyautogui.doubleClick(x=adjusted_x, y=adjusted_y)
             else:
-                print(f"더블클릭: 현재 위치")
+                logger.debug("더블클릭: 현재 위치")
                 pyautogui.doubleClick()
 
             time.sleep(self.default_delay)
             return True
 
         except Exception as e:
-            print(f"더블클릭 실패: ({x}, {y}), {e}")
+            logger.error("더블클릭 실패: (%s, %s), %s", x, y, e)
             return False
 
     def right_click(self, x: Optional[int] = None, y: Optional[int] = None) -> bool:
@@ -234,17 +321,19 @@ class InputController:
                     return False
                 time.sleep(self.click_delay)
 
-                print(f"우클릭: ({adjusted_x}, {adjusted_y}) [원본: ({x}, {y})]")
+                logger.debug(
+                    "우클릭: (%s, %s) [원본: (%s, %s)]", adjusted_x, adjusted_y, x, y
+                )
                 pyautogui.rightClick(x=adjusted_x, y=adjusted_y)
             else:
-                print(f"우클릭: 현재 위치")
+                logger.debug("우클릭: 현재 위치")
                 pyautogui.rightClick()
 
             time.sleep(self.default_delay)
             return True
 
         except Exception as e:
-            print(f"우클릭 실패: ({x}, {y}), {e}")
+            logger.error("우클릭 실패: (%s, %s), %s", x, y, e)
             return False
 
     def drag(
@@ -258,7 +347,7 @@ class InputController:
     ) -> bool:
         """드래그"""
         try:
-            print(f"드래그: ({from_x}, {from_y}) -> ({to_x}, {to_y})")
+            logger.debug("드래그: (%s, %s) -> (%s, %s)", from_x, from_y, to_x, to_y)
 
             # 시작 위치로 이동
             if not self.move_mouse(from_x, from_y):
@@ -275,7 +364,9 @@ class InputController:
             return True
 
         except Exception as e:
-            print(f"드래그 실패: ({from_x}, {from_y}) -> ({to_x}, {to_y}), {e}")
+            logger.error(
+                "드래그 실패: (%s, %s) -> (%s, %s), %s", from_x, from_y, to_x, to_y, e
+            )
             return False
 
     def scroll(
@@ -288,7 +379,7 @@ class InputController:
             # 스크롤 방향 설정
             scroll_amount = amount if direction in ["up", "right"] else -amount
 
-            print(f"스크롤: 방향={direction}, 양={amount}")
+            logger.debug("스크롤: 방향=%s, 양=%s", direction, amount)
 
             if direction in ["up", "down"]:
                 pyautogui.scroll(scroll_amount)
@@ -299,7 +390,7 @@ class InputController:
             return True
 
         except Exception as e:
-            print(f"스크롤 실패: {direction}, {amount}, {e}")
+            logger.error("스크롤 실패: %s, %s, %s", direction, amount, e)
             return False
 
     def type_text(self, text: str, interval: float = 0.02) -> bool:
@@ -308,7 +399,38 @@ class InputController:
             if not text:
                 return True
 
-            print(f"텍스트 입력: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+            logger.debug("텍스트 입력: %.50s (길이=%d)", text, len(text))
+
+            if (
+                self.direct_type_ascii
+                and len(text) <= DIRECT_TYPE_MAX_LENGTH
+                and text.isascii()
+            ):
+                # 짧은 ASCII 텍스트는 클립보드를 거치지 않고 직접 입력
+                pyautogui.write(text, interval=interval)
+            else:
+                self._paste_text(text)
+
+            time.sleep(self.default_delay)
+            return True
+
+        except Exception as e:
+            logger.error("텍스트 입력 실패: %r, %s", text, e)
+            return False
+
+    def _paste_text(self, text: str) -> None:
+        """클립보드로 텍스트 붙여넣기 (사용자의 기존 텍스트 클립보드는 나중에 복원)"""
+        with self._clipboard_lock:
+            if self._clipboard_restore is not None:
+                # 이전 붙여넣기의 복원이 대기 중이면 취소하고 그때 저장한 내용 유지
+                self._clipboard_restore.cancel()
+                self._clipboard_restore = None
+            else:
+                try:
+                    self._saved_clipboard = pyperclip.paste()
+                except Exception as e:
+                    logger.warning("클립보드 읽기 실패, 복원 생략: %s", e)
+                    self._saved_clipboard = None
 
             pyperclip.copy(text)
 
@@ -316,19 +438,37 @@ class InputController:
                 pyautogui.hotkey("command", "v")
             else:  # Windows, Linux 등
                 pyautogui.hotkey("ctrl", "v")
-            # pyautogui.write(text, interval=interval)
-
-            time.sleep(self.default_delay)
-            return True
 
-        except Exception as e:
-            print(f"텍스트 입력 실패: '{text}', {e}")
-            return False
+            # 텍스트가 아닌 내용(이미지 등)은 빈 문자열로 읽히므로 복원하지 않음
+            if self._saved_clipboard:
+                # 대상 앱의 비동기 붙여넣기가 끝날 시간을 두고 백그라운드에서 복원
+                timer = threading.Timer(
+                    CLIPBOARD_RESTORE_DELAY, self._restore_clipboard, args=(text,)
+                )
+                timer.daemon = True
+                self._clipboard_restore = timer
+                timer.start()
+
+    def _restore_clipboard(self, pasted_text: str) -> None:
+        """붙여넣기 전 클립보드 내용 복원 (그 사이 다른 내용이 복사되었으면 유지)"""
+        with self._clipboard_lock:
+            # 취소된 뒤 이미 실행된 타이머면 무시
+            if self._clipboard_restore is not threading.current_thread():
+                return
+            self._clipboard_restore = None
+
+            try:
+                if pyperclip.paste() == pasted_text:
+                    pyperclip.copy(self._saved_clipboard)
+            except Exception as e:
+                logger.warning("클립보드 복원 실패: %s", e)
+            finally:
+                self._saved_clipboard = None
 
     def press_key(self, key: str, presses: int = 1, interval: float = 0.0) -> bool:
         """키 누르기"""
         try:
-            print(f"키 입력: {key}, 횟수={presses}")
+            logger.debug("키 입력: %s, 횟수=%s", key, presses)
 
             pyautogui.press(key, presses=presses, interval=interval)
 
@@ -336,7 +476,7 @@ class InputController:
             return True
 
         except Exception as e:
-            print(f"키 입력 실패: {key}, {e}")
+            logger.error("키 입력 실패: %s, %s", key, e)
             return False
 
     def key_combination(self, keys: List[str]) -> bool:
@@ -345,7 +485,7 @@ class InputController:
             if not keys:
                 return True
 
-            print(f"키 조합: {' + '.join(keys)}")
+            logger.debug("키 조합: %s", keys)
 
             # 키 조합 실행
             if len(keys) == 1:
@@ -357,13 +497,13 @@ class InputController:
             return True
 
         except Exception as e:
-            print(f"키 조합 실패: {keys}, {e}")
+            logger.error("키 조합 실패: %s, %s", keys, e)
             return False
 
     def hold_key(self, key: str, duration: float = 1.0) -> bool:
         """키 길게 누르기"""
         try:
-            print(f"키 길게 누르기: {key}, {duration}초")
+            logger.debug("키 길게 누르기: %s, %s초", key, duration)
 
             pyautogui.keyDown(key)
             time.sleep(duration)
@@ -373,7 +513,7 @@ class InputController:
             return True
 
         except Exception as e:
-            print(f"키 길게 누르기 실패: {key}, {e}")
+            logger.error("키 길게 누르기 실패: %s, %s", key, e)
             return False
 
     def get_mouse_position(self) -> Tuple[int, int]:
@@ -381,7 +521,7 @@ class InputController:
         try:
             return pyautogui.position()
         except Exception as e:
-            print(f"마우스 위치 가져오기 실패: {e}")
+            logger.error("마우스 위치 가져오기 실패: %s", e)
             return (0, 0)
 
     def wait(self, seconds: float) -> bool:
@@ -390,20 +530,17 @@ class InputController:
             if seconds <= 0:
                 return True
 
-            print(f"대기: {seconds}초")
+            logger.debug("대기: %s초", seconds)
             time.sleep(seconds)
             return True
 
         except Exception as e:
-            print(f"대기 실패: {seconds}초, {e}")
+            logger.error("대기 실패: %s초, %s", seconds, e)
             return False
 
     def _contains_korean(self, text: str) -> bool:
         """한글 포함 여부 확인"""
-        for char in text:
-            if ord("가") <= ord(char) <= ord("힣"):
-                return True
-        return False
+        return HANGUL_PATTERN.search(text) is not None
 
     def set_delays(
         self,
@@ -422,10 +559,12 @@ class InputController:
         if mouse_move_duration is not None:
             self.mouse_move_duration = mouse_move_duration
 
-        print(
-            f"지연 시간 설정 업데이트: default={self.default_delay}, "
-            f"click={self.click_delay}, key={self.key_delay}, "
-            f"mouse_move={self.mouse_move_duration}"
+        logger.debug(
+            "지연 시간 설정 업데이트: default=%s, click=%s, key=%s, mouse_move=%s",
+            self.default_delay,
+            self.click_delay,
+            self.key_delay,
+            self.mouse_move_duration,
         )
 
     def get_controller_info(self) -> dict:
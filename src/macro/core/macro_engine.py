@@ -4,12 +4,14 @@
 
 import time
 import logging
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from pathlib import Path
 import uuid
+from collections import deque
 from datetime import datetime
 import threading
 
+import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from macro.models.macro_models import (
@@ -28,6 +30,25 @@ from macro.core.telegram_bot import SyncTelegramBot
 
 logger = logging.getLogger(__name__)
 
+# 이미지 템플릿으로 판단하는 조건 타입
+IMAGE_CONDITION_TYPES = frozenset(
+    {ConditionType.IMAGE_FOUND, ConditionType.IMAGE_NOT_FOUND}
+)
+# 실행 후 화면이 바뀔 수 있어 캐시된 스크린샷을 무효화하는 액션 타입
+SCREEN_CHANGING_ACTION_TYPES = frozenset(
+    {
+        ActionType.CLICK,
+        ActionType.IMAGE_CLICK,
+        ActionType.TYPE_TEXT,
+        ActionType.KEY_PRESS,
+        ActionType.SCROLL,
+    }
+)
+# 연속된 이미지 검사에서 스크린샷을 재사용하는 최대 시간 (초)
+SCREENSHOT_CACHE_TTL = 0.05
+# 실행 결과에 보관하는 최근 단계 결과 개수
+MAX_STEP_DETAILS = 1000
+
 
 class MacroExecutionResult:
     """매크로 실행 결과"""
@@ -39,18 +60,12 @@ class MacroExecutionResult:
         self.total_steps = 0
         self.error_message = ""
         self.failed_action_id = ""
-        self.details = []
+        # 최근 단계 결과 (action_id, success, message, time.time_ns())
+        self.details = deque(maxlen=MAX_STEP_DETAILS)
 
     def add_step_result(self, action_id: str, success: bool, message: str = ""):
         """단계 결과 추가"""
-        self.details.append(
-            {
-                "action_id": action_id,
-                "success": success,
-                "message": message,
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+        self.details.append((action_id, success, message, time.time_ns()))
 
         if success:
             self.steps_executed += 1
@@ -58,6 +73,18 @@ class MacroExecutionResult:
             self.failed_action_id = action_id
             self.error_message = message
 
+    def get_details(self) -> List[Dict[str, Any]]:
+        """단계 결과 목록 반환 (시각은 조회할 때 ISO 형식으로 변환)"""
+        return [
+            {
+                "action_id": action_id,
+                "success": success,
+                "message": message,
+                "timestamp": datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(),
+            }
+            for action_id, success, message, timestamp_ns in self.details
+        ]
+
 
 class MacroEngine(QObject):
     """매크로 실행 엔진"""
@@ -79,17 +106,43 @@ class MacroEngine(QObject):
         self.input_controller = InputController()
         self.telegram_bot = SyncTelegramBot()
 
-        # 스케일 팩터 동기화 (screen_capture와 input_controller 간)
-        self._sync_scale_factors()
+        # 스케일 팩터 동기화 여부 (전체 화면 캡쳐가 필요하므로 첫 실행 시 수행)
+        self._scale_factors_synced = False
 
         # 실행 상태
         self.is_running = False
         self.current_sequence: Optional[MacroSequence] = None
         self.execution_thread: Optional[threading.Thread] = None
-        self.stop_requested = False
+        # 중단 요청 (대기 중인 WAIT 액션도 즉시 깨움)
+        self._stop_event = threading.Event()
         self.restart_requested = False
         self.current_action_index = 0
 
+        # 액션 타입별 실행 함수
+        self._action_handlers: Dict[ActionType, Callable[[MacroAction], bool]] = {
+            ActionType.CLICK: self._execute_click_action,
+            ActionType.IMAGE_CLICK: self._execute_image_click_action,
+            ActionType.TYPE_TEXT: self._execute_type_text_action,
+            ActionType.KEY_PRESS: self._execute_key_press_action,
+            ActionType.SCROLL: self._execute_scroll_action,
+            ActionType.WAIT: self._execute_wait_action,
+            ActionType.SEND_TELEGRAM: self._execute_telegram_action,
+            ActionType.IF: self._execute_if_action,
+            ActionType.ELSE: self._execute_else_action,
+        }
+
+        # 최근 스크린샷 캐시 (캡쳐 시각, 이미지)
+        self._screenshot_cache: Optional[Tuple[float, np.ndarray]] = None
+        # 마지막으로 화면을 바꾼 액션이 끝난 시각 (이후 프레임만 사용)
+        self._screen_changed_at = 0.0
+
+        # 마지막 IF 조건 결과 (ELSE에서 사용)
+        self._last_if_result: Optional[bool] = None
+
+        # 시퀀스 실행 시작 시 만드는 템플릿 조회 인덱스
+        self._template_by_id: Dict[str, ImageTemplate] = {}
+        self._template_exists: Dict[str, bool] = {}
+
         # 콜백 함수들
         self.on_sequence_start: Optional[Callable[[str], None]] = None
         self.on_sequence_complete: Optional[
@@ -118,27 +171,30 @@ class MacroEngine(QObject):
 
             # 두 스케일 팩터가 다르면 경고하고 더 안전한 값을 사용
             if abs(screen_scale - input_scale) > 0.1:
-                print(
-                    f"스케일 팩터 불일치: ScreenCapture={screen_scale}, InputController={input_scale}"
+                logger.warning(
+                    "스케일 팩터 불일치: ScreenCapture=%s, InputController=%s",
+                    screen_scale,
+                    input_scale,
                 )
                 # 더 작은 값을 사용 (안전한 쪽으로)
                 safe_scale = min(screen_scale, input_scale)
                 self.input_controller.scale_factor = safe_scale
-                print(f"스케일 팩터를 {safe_scale}로 통일했습니다")
+                logger.info("스케일 팩터를 %s로 통일했습니다", safe_scale)
             else:
-                print(f"스케일 팩터 동기화 완료: {screen_scale}")
+                logger.info("스케일 팩터 동기화 완료: %s", screen_scale)
+            self._scale_factors_synced = True
 
         except Exception as e:
-            print(f"스케일 팩터 동기화 실패: {e}")
+            logger.error("스케일 팩터 동기화 실패: %s", e)
 
     def load_config(self) -> bool:
         """설정 파일 로드"""
         try:
             if Path(self.config_path).exists():
                 self.config = MacroConfig.load_from_file(self.config_path)
-                print(f"설정 파일 로드됨: {self.config_path}")
+                logger.info("설정 파일 로드됨: %s", self.config_path)
             else:
-                print("설정 파일이 없어서 기본 설정으로 시작합니다")
+                logger.info("설정 파일이 없어서 기본 설정으로 시작합니다")
                 self.save_config()
 
             # 텔레그램 봇 설정 적용
@@ -147,17 +203,17 @@ class MacroEngine(QObject):
             return True
 
         except Exception as e:
-            print(f"설정 파일 로드 실패: {e}")
+            logger.error("설정 파일 로드 실패: %s", e)
             return False
 
     def save_config(self) -> bool:
         """설정 파일 저장"""
         try:
             self.config.save_to_file(self.config_path)
-            print("설정 파일 저장됨")
+            logger.debug("설정 파일 저장됨")
             return True
         except Exception as e:
-            print(f"설정 파일 저장 실패: {e}")
+            logger.error("설정 파일 저장 실패: %s", e)
             return False
 
     def add_image_template(
@@ -179,22 +235,32 @@ class MacroEngine(QObject):
         self.config.add_image_template(template)
         self.save_config()
 
-        print(f"이미지 템플릿 추가됨: {name} ({template_id})")
+        logger.info("이미지 템플릿 추가됨: %s (%s)", name, template_id)
         return template_id
 
     def execute_sequence_async(self) -> None:
         """매크로 시퀀스 비동기 실행"""
         if self.is_running:
-            print("다른 매크로가 실행 중입니다")
+            logger.warning("다른 매크로가 실행 중입니다")
             return
 
         sequence = self.config.macro_sequence
-        print(f"시퀀스 시작")
+        logger.debug("시퀀스 시작")
 
         def run_sequence():
-            result = self._execute_sequence_sync(sequence)
+            # 이미지 매칭이 있는 시퀀스만 캡쳐를 별도 스레드로 돌려 매칭/입력과 겹치도록 함
+            if self._uses_image_matching(sequence):
+                self.screen_capture.start_background_capture(
+                    grayscale=self.config.grayscale_matching
+                )
+            try:
+                result = self._execute_sequence_sync(sequence)
+            finally:
+                self.screen_capture.stop_background_capture()
+                # 실행 스레드에서 직접 캡쳐할 때 연 세션도 닫음
+                self.screen_capture.close_thread_session()
             # 시그널 발생 (스레드에서 안전함)
-            print(f"시퀀스 완료 시그널 발생:")
+            logger.debug("시퀀스 완료 시그널 발생")
 
             if (
                 self.telegram_bot.is_configured()
@@ -218,11 +284,30 @@ class MacroEngine(QObject):
         try:
             self.is_running = True
             self.current_sequence = sequence
-            self.stop_requested = False
+            self._stop_event.clear()
             self.restart_requested = False
+            self._screenshot_cache = None
+            self._screen_changed_at = time.monotonic()
+            self._last_if_result = None
 
             result.total_steps = len(sequence.actions)
 
+            # 액션마다 목록 검색/파일 확인을 반복하지 않도록 미리 인덱싱
+            self._template_by_id = {t.id: t for t in self.config.image_templates}
+            self._template_exists = {
+                t.id: Path(t.file_path).exists() for t in self.config.image_templates
+            }
+
+            # 템플릿 이미지를 미리 디코딩해 첫 매칭에서 파일을 읽지 않도록 함
+            self.image_matcher.set_grayscale(self.config.grayscale_matching)
+            self.image_matcher.set_use_opencl(self.config.opencl_matching)
+            self.input_controller.direct_type_ascii = self.config.direct_type_ascii
+            if not self._scale_factors_synced:
+                self._sync_scale_factors()
+            for template in self._template_by_id.values():
+                if self._template_exists[template.id]:
+                    self.image_matcher.preload_template(template.file_path)
+
             # 시퀀스 시작 시그널 발생
             self.sequence_started.emit()
 
@@ -230,27 +315,31 @@ class MacroEngine(QObject):
             if self.on_sequence_start:
                 self.on_sequence_start()
 
-            print(f"매크로 시퀀스 실행 시작: {sequence.name}")
+            logger.info("매크로 시퀀스 실행 시작: %s", sequence.name)
+
+            # 비활성화된 액션은 루프마다 확인하지 않도록 미리 제외
+            active_actions = []
+            for action in sequence.actions:
+                if action.enabled:
+                    active_actions.append(action)
+                else:
+                    logger.debug("비활성화된 액션 건너뜀: %s", action.id)
 
             # 루프 실행
             loop_index = 0
             while loop_index < sequence.loop_count:
                 loop_index += 1
 
-                if self.stop_requested:
+                if self._stop_event.is_set():
                     break
 
-                print(f"루프 {loop_index + 1}/{sequence.loop_count} 시작")
+                logger.debug("루프 %s/%s 시작", loop_index, sequence.loop_count)
 
                 # 액션들 실행
-                for action in sequence.actions:
-                    if self.stop_requested:
+                for action in active_actions:
+                    if self._stop_event.is_set():
                         break
 
-                    if not action.enabled:
-                        print(f"비활성화된 액션 건너뜀: {action.id}")
-                        continue
-
                     # 액션 실행 시그널 발생
                     self.action_executed.emit(action)
 
@@ -260,6 +349,10 @@ class MacroEngine(QObject):
 
                     action_success = self._execute_action(action)
 
+                    if action.action_type in SCREEN_CHANGING_ACTION_TYPES:
+                        self._screenshot_cache = None
+                        self._screen_changed_at = time.monotonic()
+
                     if action_success:
                         result.add_step_result(action.id, True, "성공")
                     else:
@@ -268,7 +361,7 @@ class MacroEngine(QObject):
 
                     # 재시작 요청 확인
                     if self.restart_requested:
-                        print("매크로 재시작 요청으로 처음부터 다시 실행")
+                        logger.info("매크로 재시작 요청으로 처음부터 다시 실행")
                         break
 
                 # 재시작 요청이 있으면 루프도 처음부터 시작
@@ -280,7 +373,7 @@ class MacroEngine(QObject):
             # 실행 결과 판정
             result.success = (
                 result.steps_executed > 0
-                and not self.stop_requested
+                and not self._stop_event.is_set()
                 and result.steps_executed >= result.total_steps * 0.8  # 80% 이상 성공
             )
 
@@ -293,13 +386,15 @@ class MacroEngine(QObject):
             self.execution_stats["total_actions_executed"] += result.steps_executed
             self.execution_stats["last_execution_time"] = datetime.now().isoformat()
 
-            print(
-                f"매크로 시퀀스 실행 완료: {sequence.name}, "
-                f"성공: {result.success}, 실행시간: {result.execution_time:.2f}초"
+            logger.info(
+                "매크로 시퀀스 실행 완료: %s, 성공: %s, 실행시간: %.2f초",
+                sequence.name,
+                result.success,
+                time.time() - start_time,
             )
 
         except Exception as e:
-            print(f"매크로 실행 중 오류: {e}")
+            logger.error("매크로 실행 중 오류: %s", e)
             result.error_message = str(e)
             result.success = False
 
@@ -314,7 +409,7 @@ class MacroEngine(QObject):
             result.execution_time = time.time() - start_time
             self.is_running = False
             self.current_sequence = None
-            self.stop_requested = False
+            self._stop_event.clear()
             self.restart_requested = False
 
         return result
@@ -322,41 +417,17 @@ class MacroEngine(QObject):
     def _execute_action(self, action: MacroAction) -> bool:
         """개별 액션 실행"""
         try:
-            print(f"액션 실행: {action.action_type}")
-
-            if action.action_type == ActionType.CLICK:
-                return self._execute_click_action(action)
-
-            elif action.action_type == ActionType.IMAGE_CLICK:
-                return self._execute_image_click_action(action)
+            logger.debug("액션 실행: %s", action.action_type)
 
-            elif action.action_type == ActionType.TYPE_TEXT:
-                return self._execute_type_text_action(action)
-
-            elif action.action_type == ActionType.KEY_PRESS:
-                return self._execute_key_press_action(action)
-
-            elif action.action_type == ActionType.SCROLL:
-                return self._execute_scroll_action(action)
-
-            elif action.action_type == ActionType.WAIT:
-                return self._execute_wait_action(action)
-
-            elif action.action_type == ActionType.SEND_TELEGRAM:
-                return self._execute_telegram_action(action)
-
-            elif action.action_type == ActionType.IF:
-                return self._execute_if_action(action)
-
-            elif action.action_type == ActionType.ELSE:
-                return self._execute_else_action(action)
-
-            else:
-                print(f"지원하지 않는 액션 타입: {action.action_type}")
+            handler = self._action_handlers.get(action.action_type)
+            if handler is None:
+                logger.warning("지원하지 않는 액션 타입: %s", action.action_type)
                 return False
 
+            return handler(action)
+
         except Exception as e:
-            print(f"액션 실행 중 오류: {action.action_type}, {e}")
+            logger.error("액션 실행 중 오류: %s, %s", action.action_type, e)
             return False
 
     def _execute_click_action(self, action: MacroAction) -> bool:
@@ -368,7 +439,7 @@ class MacroEngine(QObject):
             )
 
         else:
-            print("클릭 위치가 설정되지 않았습니다")
+            logger.warning("클릭 위치가 설정되지 않았습니다")
             return False
 
     def _execute_image_click_action(
@@ -376,68 +447,70 @@ class MacroEngine(QObject):
     ) -> bool:
         """클릭 액션 실행"""
         if not action.image_template_id or not action.click_position:
-            print("이미지 템플릿과 클릭 위치가 모두 필요합니다")
+            logger.warning("이미지 템플릿과 클릭 위치가 모두 필요합니다")
             return False
 
-        template = self.config.get_image_template(action.image_template_id)
+        template = self._template_by_id.get(action.image_template_id)
         if not template:
-            print(f"이미지 템플릿을 찾을 수 없습니다: {action.image_template_id}")
+            logger.warning(
+                "이미지 템플릿을 찾을 수 없습니다: %s", action.image_template_id
+            )
             return False
 
         # 이미지 파일 존재 확인
-        from pathlib import Path
-
-        if not Path(template.file_path).exists():
-            print(f"이미지 파일이 존재하지 않습니다: {template.file_path}")
+        if not self._template_exists.get(template.id):
+            logger.warning("이미지 파일이 존재하지 않습니다: %s", template.file_path)
             return False
 
-        print(f"이미지 매칭 시도: {template.name} ({template.file_path})")
+        logger.debug("이미지 매칭 시도: %s (%s)", template.name, template.file_path)
 
-        screenshot = self.screen_capture.capture_full_screen()
+        screenshot = self._get_screenshot_cached()
         if screenshot is None:
-            print("스크린샷 캡쳐 실패")
+            logger.warning("스크린샷 캡쳐 실패")
             return False
 
         # 매칭 임계값 설정 (기본값 또는 템플릿 설정)
         threshold = (
             getattr(action, "match_threshold", None) or template.threshold or 0.8
         )
-        print(f"매칭 임계값: {threshold}")
+        logger.debug("매칭 임계값: %s", threshold)
 
+        # 매칭된 이미지의 상단 좌측 좌표에서 액션 클릭 위치만큼 오프셋 적용
         match_result = self.image_matcher.find_image_in_screenshot(
             screenshot,
             template.file_path,
             action.selected_region,
             threshold,
+            click_offset=action.click_position,
         )
 
         if not match_result.found:
-            print(
-                f"이미지 매칭 실패: {template.name}, 임계값: {threshold}, 최대 신뢰도: {match_result.confidence:.3f}"
+            logger.debug(
+                "이미지 매칭 실패: %s, 임계값: %s, 최대 신뢰도: %.3f",
+                template.name,
+                threshold,
+                match_result.confidence,
             )
 
             # 이미지 탐색 실패 시 처리 옵션에 따른 동작
             return self._handle_image_search_failure(action)
 
-        print(
-            f"이미지 매칭 성공: {template.name}, 신뢰도: {match_result.confidence:.3f}, 매칭 위치: {match_result.center_position}"
+        logger.debug(
+            "이미지 매칭 성공: %s, 신뢰도: %.3f, 매칭 위치: %s",
+            template.name,
+            match_result.confidence,
+            match_result.center_position,
         )
 
-        # 액션에서 설정한 클릭 위치 사용 (필수)
-        if not action.click_position:
-            print(f"액션에 클릭 위치가 설정되지 않았습니다: {action.id}")
-            return False
-
-        # 매칭된 이미지의 상단 좌측 좌표에서 액션 클릭 위치만큼 오프셋 적용
-        match_top_left = match_result.top_left
-        action_click_x, action_click_y = action.click_position
+        # 실제 클릭할 화면 좌표
+        actual_click_x, actual_click_y = match_result.click_position
 
-        # 실제 클릭할 화면 좌표 계산
-        actual_click_x = match_top_left[0] + action_click_x
-        actual_click_y = match_top_left[1] + action_click_y
-
-        print(
-            f"클릭 위치 계산: 매칭 시작점({match_top_left}) + 액션 오프셋({action.click_position}) = 실제 클릭({actual_click_x}, {actual_click_y})"
+        logger.debug(
+            "클릭 위치 계산: 매칭 시작점(%s) + 액션 오프셋(%s) = 실제 클릭(%s, %s)",
+            match_result.top_left,
+            action.click_position,
+            actual_click_x,
+            actual_click_y,
         )
 
         if double_click:
@@ -447,10 +520,44 @@ class MacroEngine(QObject):
         else:
             return self.input_controller.click(actual_click_x, actual_click_y)
 
+    def _uses_image_matching(self, sequence: MacroSequence) -> bool:
+        """시퀀스에 화면 캡쳐가 필요한 활성 액션이 있는지 확인"""
+        for action in sequence.actions:
+            if not action.enabled:
+                continue
+            if action.action_type == ActionType.IMAGE_CLICK:
+                return True
+            if (
+                action.action_type == ActionType.IF
+                and action.condition_type in IMAGE_CONDITION_TYPES
+            ):
+                return True
+        return False
+
+    def _get_screenshot_cached(self) -> Optional[np.ndarray]:
+        """화면 캡쳐 (화면을 바꾸는 액션 없이 연속 호출되면 직전 캡쳐 재사용)"""
+        if self.screen_capture.is_background_capture_running():
+            screenshot = self.screen_capture.get_latest_frame(self._screen_changed_at)
+            if screenshot is not None:
+                return screenshot
+
+        now = time.monotonic()
+        if self._screenshot_cache is not None:
+            captured_at, screenshot = self._screenshot_cache
+            if now - captured_at < SCREENSHOT_CACHE_TTL:
+                return screenshot
+
+        screenshot = self.screen_capture.capture_full_screen(
+            grayscale=self.image_matcher.grayscale
+        )
+        if screenshot is not None:
+            self._screenshot_cache = (now, screenshot)
+        return screenshot
+
     def _execute_type_text_action(self, action: MacroAction) -> bool:
         """텍스트 입력 액션 실행"""
         if not action.text_input:
-            print("입력할 텍스트가 없습니다")
+            logger.debug("입력할 텍스트가 없습니다")
             return True
 
         return self.input_controller.type_text(action.text_input)
@@ -460,7 +567,7 @@ class MacroEngine(QObject):
         if action.key_combination:
             return self.input_controller.key_combination(action.key_combination)
         else:
-            print("입력할 키가 지정되지 않았습니다")
+            logger.warning("입력할 키가 지정되지 않았습니다")
             return False
 
     def _execute_scroll_action(self, action: MacroAction) -> bool:
@@ -474,16 +581,19 @@ class MacroEngine(QObject):
     def _execute_wait_action(self, action: MacroAction) -> bool:
         """대기 액션 실행"""
         seconds = action.wait_seconds or 1.0
-        return self.input_controller.wait(seconds)
+        logger.debug("대기: %s초", seconds)
+
+        # 중단 요청이 오면 남은 시간을 기다리지 않고 바로 반환
+        return not self._stop_event.wait(timeout=seconds)
 
     def _execute_telegram_action(self, action: MacroAction) -> bool:
         """텔레그램 메시지 전송 액션 실행"""
         if not action.telegram_message:
-            print("전송할 텔레그램 메시지가 없습니다")
+            logger.debug("전송할 텔레그램 메시지가 없습니다")
             return True
 
         if not self.telegram_bot.is_configured():
-            print("텔레그램이 설정되지 않았습니다")
+            logger.warning("텔레그램이 설정되지 않았습니다")
             return False
 
         return self.telegram_bot.send_message(action.telegram_message)
@@ -491,13 +601,22 @@ class MacroEngine(QObject):
     def stop_execution(self) -> None:
         """매크로 실행 중단"""
         if self.is_running:
-            print("매크로 실행 중단 요청됨")
-            self.stop_requested = True
+            logger.info("매크로 실행 중단 요청됨")
+            self._stop_event.set()
 
-            # 스레드 대기 (최대 5초)
-            if self.execution_thread and self.execution_thread.is_alive():
+            # 스레드 대기 (최대 5초, 실행 스레드 자신이 호출한 경우 제외)
+            if (
+                self.execution_thread
+                and self.execution_thread.is_alive()
+                and self.execution_thread is not threading.current_thread()
+            ):
                 self.execution_thread.join(timeout=5.0)
 
+    @property
+    def stop_requested(self) -> bool:
+        """중단 요청 여부"""
+        return self._stop_event.is_set()
+
     def get_execution_status(self) -> Dict[str, Any]:
         """실행 상태 정보 반환"""
         return {
@@ -515,7 +634,7 @@ class MacroEngine(QObject):
             action, "on_image_not_found", ImageSearchFailureAction.STOP_EXECUTION
         )
 
-        print(f"이미지 탐색 실패 처리: {failure_action.value}")
+        logger.debug("이미지 탐색 실패 처리: %s", failure_action.value)
 
         if failure_action == ImageSearchFailureAction.RESTART_SEQUENCE:
             # 매크로 처음부터 재실행
@@ -524,66 +643,54 @@ class MacroEngine(QObject):
 
         elif failure_action == ImageSearchFailureAction.SKIP_TO_NEXT:
             # 무시하고 다음 단계
-            print("현재 액션 건너뛰고 다음 단계로 진행")
+            logger.debug("현재 액션 건너뛰고 다음 단계로 진행")
             return True
 
         else:  # STOP_EXECUTION
             # 실행 중단
-            print("이미지 탐색 실패로 시퀀스 중단")
+            logger.info("이미지 탐색 실패로 시퀀스 중단")
             self.stop_execution()
             return False
 
     def _execute_if_action(self, action: MacroAction) -> bool:
         """IF 액션 실행 - 조건 체크"""
         try:
-            print(f"IF 조건 체크: {action.condition_type}")
+            logger.debug("IF 조건 체크: %s", action.condition_type)
 
             if not action.condition_type:
-                print("IF 액션에 조건 타입이 설정되지 않음")
+                logger.warning("IF 액션에 조건 타입이 설정되지 않음")
                 return False
 
             # 조건 체크
             condition_result = self._check_condition(action)
 
             # 조건 결과를 실행 컨텍스트에 저장 (ELSE에서 사용)
-            if not hasattr(self, "_condition_results"):
-                self._condition_results = {}
-            self._condition_results[action.id] = condition_result
+            self._last_if_result = condition_result
 
-            print(f"IF 조건 결과: {condition_result}")
+            logger.debug("IF 조건 결과: %s", condition_result)
             return True  # IF 액션 자체는 항상 성공 (조건 체크만 수행)
 
         except Exception as e:
-            print(f"IF 액션 실행 실패: {e}")
+            logger.error("IF 액션 실행 실패: %s", e)
             return False
 
     def _execute_else_action(self, action: MacroAction) -> bool:
         """ELSE 액션 실행 - 이전 IF 조건의 반대 결과 사용"""
         try:
-            print("ELSE 조건 체크")
-
-            # 이전 IF 조건 결과 찾기
-            if not hasattr(self, "_condition_results"):
-                print("ELSE 액션 실행 시 이전 IF 조건 결과가 없음")
-                return False
+            logger.debug("ELSE 조건 체크")
 
             # 마지막 IF 조건 결과 사용
-            last_if_result = None
-            for result in reversed(list(self._condition_results.values())):
-                last_if_result = result
-                break
-
-            if last_if_result is None:
-                print("ELSE 액션 실행 시 참조할 IF 조건 결과가 없음")
+            if self._last_if_result is None:
+                logger.warning("ELSE 액션 실행 시 참조할 IF 조건 결과가 없음")
                 return False
 
             # ELSE는 IF의 반대 결과
-            else_result = not last_if_result
-            print(f"ELSE 조건 결과: {else_result}")
+            else_result = not self._last_if_result
+            logger.debug("ELSE 조건 결과: %s", else_result)
             return True  # ELSE 액션 자체는 항상 성공
 
         except Exception as e:
-            print(f"ELSE 액션 실행 실패: {e}")
+            logger.error("ELSE 액션 실행 실패: %s", e)
             return False
 
     def _check_condition(self, action: MacroAction) -> bool:
@@ -592,24 +699,23 @@ class MacroEngine(QObject):
             if action.condition_type == ConditionType.ALWAYS:
                 return True
 
-            elif action.condition_type in [
-                ConditionType.IMAGE_FOUND,
-                ConditionType.IMAGE_NOT_FOUND,
-            ]:
+            elif action.condition_type in IMAGE_CONDITION_TYPES:
                 if not action.image_template_id:
-                    print("이미지 기반 조건이지만 이미지 템플릿이 설정되지 않음")
+                    logger.warning("이미지 기반 조건이지만 이미지 템플릿이 설정되지 않음")
                     return False
 
                 # 이미지 템플릿 가져오기 (IF 액션도 동일한 image_template_id 사용)
-                template = self.config.get_image_template(action.image_template_id)
+                template = self._template_by_id.get(action.image_template_id)
                 if not template:
-                    print(f"이미지 템플릿을 찾을 수 없음: {action.image_template_id}")
+                    logger.warning(
+                        "이미지 템플릿을 찾을 수 없음: %s", action.image_template_id
+                    )
                     return False
 
                 # 화면 캡쳐
-                screenshot = self.screen_capture.capture_screenshot()
+                screenshot = self._get_screenshot_cached()
                 if screenshot is None:
-                    print("조건 체크용 화면 캡쳐 실패")
+                    logger.warning("조건 체크용 화면 캡쳐 실패")
                     return False
 
                 # 이미지 매칭
@@ -621,8 +727,10 @@ class MacroEngine(QObject):
                 )
 
                 image_found = match_result.found
-                print(
-                    f"조건 이미지 매칭 결과: {image_found}, 신뢰도: {match_result.confidence:.3f}"
+                logger.debug(
+                    "조건 이미지 매칭 결과: %s, 신뢰도: %.3f",
+                    image_found,
+                    match_result.confidence,
                 )
 
                 if action.condition_type == ConditionType.IMAGE_FOUND:
@@ -631,11 +739,11 @@ class MacroEngine(QObject):
                     return not image_found
 
             else:
-                print(f"알 수 없는 조건 타입: {action.condition_type}")
+                logger.warning("알 수 없는 조건 타입: %s", action.condition_type)
                 return False
 
         except Exception as e:
-            print(f"조건 체크 실패: {e}")
+            logger.error("조건 체크 실패: %s", e)
             return False
 
     def cleanup(self) -> None:
@@ -643,4 +751,4 @@ class MacroEngine(QObject):
         self.stop_execution()
         self.image_matcher.clear_cache()
         self.telegram_bot.close()
-        print("매크로 엔진 정리 완료")
+        logger.info("매크로 엔진 정리 완료")
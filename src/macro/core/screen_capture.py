@@ -5,26 +5,45 @@
 import cv2
 import numpy as np
 import pyautogui
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import logging
 import platform
+import threading
+import time
 
 try:
     import screeninfo
 except ImportError:
     screeninfo = None
 
+try:
+    import mss
+except ImportError:
+    mss = None
+
+try:
+    import Quartz  # macOS 전용 (PyAutoGUI 의존성으로 설치됨)
+except ImportError:
+    Quartz = None
+
 
 logger = logging.getLogger(__name__)
 
+# 백그라운드 캡쳐 기본 프레임 수 (초당)
+BACKGROUND_CAPTURE_FPS = 30
+# 백그라운드 캡쳐 스레드 종료 대기 시간 (초)
+BACKGROUND_CAPTURE_JOIN_TIMEOUT = 2.0
+
 
 class ScreenCapture:
     """화면 캡쳐 관리 클래스"""
 
+    # 디스플레이 스케일 팩터 (처음 필요할 때 프로세스당 한 번만 계산)
+    _cached_scale_factor: Optional[float] = None
+
     def __init__(self):
-        # PyAutoGUI 설정
+        # PyAutoGUI 설정 (동작 간 대기는 InputController의 지연 설정으로 제어)
         pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.1
 
         # 모니터 정보 캐시
         self._monitors: Optional[List[dict]] = None
@@ -36,13 +55,38 @@ class ScreenCapture:
         # 스크린샷 품질 설정
         self.screenshot_format = "PNG"
 
-        # 디스플레이 스케일 팩터 (HiDPI 대응)
-        self.scale_factor = self._get_display_scale_factor()
-
-        logger.info(f"ScreenCapture - Display scale factor: {self.scale_factor}")
+        # mss 캡쳐 세션 (플랫폼 핸들이 스레드에 묶이므로 스레드별로 유지)
+        self._mss_local = threading.local()
+
+        # 백그라운드 캡쳐 상태 (최신 프레임: 캡쳐 시작 시각, 이미지)
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_stop = threading.Event()
+        self._frame_condition = threading.Condition()
+        self._latest_frame: Optional[Tuple[float, np.ndarray]] = None
+        self._capture_interval = 1.0 / BACKGROUND_CAPTURE_FPS
+
+    @property
+    def scale_factor(self) -> float:
+        """디스플레이 스케일 팩터 (HiDPI 대응)"""
+        if ScreenCapture._cached_scale_factor is None:
+            ScreenCapture._cached_scale_factor = self._get_display_scale_factor()
+            logger.info(
+                f"ScreenCapture - Display scale factor: {self._cached_scale_factor}"
+            )
+        return ScreenCapture._cached_scale_factor
 
     def _get_display_scale_factor(self) -> float:
         """디스플레이 스케일 팩터 계산"""
+        if self.platform == "darwin" and Quartz is not None:
+            # macOS는 디스플레이 모드의 픽셀/포인트 비율로 계산 (스크린샷 불필요)
+            try:
+                mode = Quartz.CGDisplayCopyDisplayMode(Quartz.CGMainDisplayID())
+                pixel_width = Quartz.CGDisplayModeGetPixelWidth(mode)
+                point_width = Quartz.CGDisplayModeGetWidth(mode)
+                return pixel_width / point_width
+            except Exception as e:
+                logger.warning(f"ScreenCapture - 디스플레이 모드 조회 실패: {e}")
+
         try:
             # PyAutoGUI의 화면 크기와 실제 스크린샷 크기 비교
             screen_size = pyautogui.size()
@@ -139,12 +183,35 @@ class ScreenCapture:
         logger.debug(f"모니터 정보: {len(monitors)}개 모니터 감지")
         return monitors
 
+    def _get_mss(self):
+        """현재 스레드의 mss 캡쳐 세션 반환 (mss 미설치 시 None)"""
+        if mss is None:
+            return None
+
+        sct = getattr(self._mss_local, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            self._mss_local.sct = sct
+        return sct
+
+    def close_thread_session(self) -> None:
+        """현재 스레드의 mss 캡쳐 세션 종료 (X11 연결/GDI DC 반환)"""
+        sct = getattr(self._mss_local, "sct", None)
+        if sct is None:
+            return
+
+        self._mss_local.sct = None
+        try:
+            sct.close()
+        except Exception as e:
+            logger.warning(f"캡쳐 세션 종료 실패: {e}")
 
     def capture_full_screen(
-        self, monitor_id: Optional[int] = None
+        self, monitor_id: Optional[int] = None, grayscale: bool = False
     ) -> Optional[np.ndarray]:
-        """전체 화면 캡쳐"""
+        """전체 화면 캡쳐 (grayscale이면 흑백 단일 채널로 반환)"""
         try:
+            region = None
             if monitor_id is not None:
                 monitors = self.get_monitors()
                 if monitor_id < len(monitors):
@@ -155,15 +222,35 @@ class ScreenCapture:
                         monitor["width"],
                         monitor["height"],
                     )
-                    screenshot = pyautogui.screenshot(region=region)
                 else:
                     logger.warning(f"유효하지 않은 모니터 ID: {monitor_id}")
-                    screenshot = pyautogui.screenshot()
+
+            sct = self._get_mss()
+            if sct is not None:
+                if region:
+                    x, y, width, height = region
+                    area = {"left": x, "top": y, "width": width, "height": height}
+                elif self.platform == "linux":
+                    # monitors[0]은 전체 모니터 합친 영역 (X11 가상 화면, 원점 (0, 0))
+                    # pyautogui와 같이 전체 가상 화면을 캡쳐해 화면 좌표와 일치시킴
+                    area = sct.monitors[0]
+                else:
+                    # Windows/macOS는 pyautogui와 같이 주 모니터(원점 (0, 0))만 캡쳐
+                    area = sct.monitors[1]
+
+                # mss는 BGRA 버퍼를 반환하므로 PIL 변환 없이 바로 변환
+                screenshot_cv = cv2.cvtColor(
+                    np.asarray(sct.grab(area)),
+                    cv2.COLOR_BGRA2GRAY if grayscale else cv2.COLOR_BGRA2BGR,
+                )
             else:
-                screenshot = pyautogui.screenshot()
+                screenshot = pyautogui.screenshot(region=region)
 
-            # PIL Image를 OpenCV 포맷으로 변환
-            screenshot_cv = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+                # PIL Image를 OpenCV 포맷으로 변환 (asarray로 중간 복사본 생략)
+                screenshot_cv = cv2.cvtColor(
+                    np.asarray(screenshot),
+                    cv2.COLOR_RGB2GRAY if grayscale else cv2.COLOR_RGB2BGR,
+                )
 
             logger.debug(f"전체 화면 캡쳐 완료: {screenshot_cv.shape}")
             return screenshot_cv
@@ -171,3 +258,98 @@ class ScreenCapture:
         except Exception as e:
             logger.error(f"전체 화면 캡쳐 실패: {e}")
             return None
+
+    def supports_background_capture(self) -> bool:
+        """백그라운드 캡쳐 가능 여부 (세션을 재사용하는 mss 백엔드가 있을 때만)"""
+        return mss is not None
+
+    def start_background_capture(
+        self, fps: int = BACKGROUND_CAPTURE_FPS, grayscale: bool = False
+    ) -> bool:
+        """백그라운드 스레드에서 주기적으로 화면을 캡쳐해 최신 프레임 유지"""
+        if not self.supports_background_capture():
+            return False
+
+        if self._capture_thread is not None:
+            if not self._capture_stop.is_set():
+                return True  # 이미 실행 중
+
+            # 이전 실행의 스레드가 아직 종료 중이면 겹쳐 실행하지 않음
+            self._capture_thread.join(timeout=BACKGROUND_CAPTURE_JOIN_TIMEOUT)
+            if self._capture_thread.is_alive():
+                logger.warning("이전 백그라운드 캡쳐가 종료되지 않아 직접 캡쳐합니다")
+                return False
+            self._capture_thread = None
+
+        self._capture_stop.clear()
+        self._capture_interval = 1.0 / fps
+        with self._frame_condition:
+            self._latest_frame = None
+
+        self._capture_thread = threading.Thread(
+            target=self._background_capture_loop,
+            args=(self._capture_interval, grayscale),
+            daemon=True,
+        )
+        self._capture_thread.start()
+        logger.debug(f"백그라운드 캡쳐 시작: {fps}fps")
+        return True
+
+    def stop_background_capture(self) -> None:
+        """백그라운드 캡쳐 중지"""
+        if self._capture_thread is None:
+            return
+
+        self._capture_stop.set()
+        self._capture_thread.join(timeout=BACKGROUND_CAPTURE_JOIN_TIMEOUT)
+        if self._capture_thread.is_alive():
+            # 캡쳐 도중이면 핸들을 유지해 다음 시작 시 종료를 다시 기다림
+            logger.warning("백그라운드 캡쳐 스레드가 아직 종료되지 않았습니다")
+        else:
+            self._capture_thread = None
+
+        with self._frame_condition:
+            self._latest_frame = None
+        logger.debug("백그라운드 캡쳐 중지")
+
+    def is_background_capture_running(self) -> bool:
+        """백그라운드 캡쳐 실행 여부 (중지 요청된 스레드는 제외)"""
+        return (
+            self._capture_thread is not None
+            and self._capture_thread.is_alive()
+            and not self._capture_stop.is_set()
+        )
+
+    def _background_capture_loop(self, interval: float, grayscale: bool) -> None:
+        """백그라운드 캡쳐 루프"""
+        try:
+            while not self._capture_stop.is_set():
+                captured_at = time.monotonic()
+                frame = self.capture_full_screen(grayscale=grayscale)
+                if frame is not None:
+                    # 참조만 교체하므로 읽는 쪽과 이미지 복사 없이 공유
+                    with self._frame_condition:
+                        self._latest_frame = (captured_at, frame)
+                        self._frame_condition.notify_all()
+
+                self._capture_stop.wait(
+                    max(0.0, interval - (time.monotonic() - captured_at))
+                )
+        finally:
+            self.close_thread_session()
+
+    def get_latest_frame(
+        self, newer_than: float = 0.0, timeout: Optional[float] = None
+    ) -> Optional[np.ndarray]:
+        """newer_than(time.monotonic 기준) 이후에 캡쳐를 시작한 최신 프레임 반환"""
+        if timeout is None:
+            # 다음 프레임 한 장 정도만 기다리고, 없으면 호출 측이 직접 캡쳐
+            timeout = self._capture_interval
+
+        with self._frame_condition:
+            ready = self._frame_condition.wait_for(
+                lambda: self._latest_frame is not None
+                and self._latest_frame[0] >= newer_than,
+                timeout=timeout,
+            )
+            return self._latest_frame[1] if ready else None
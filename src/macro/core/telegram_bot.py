@@ -22,6 +22,14 @@ class TelegramBot:
         # self.base_url = "https://api.telegram.org/bot${botToken}/sendmessage?chat_id=${chatId}&text=${msg}"
         self.base_url = "https://api.telegram.org/bot"
         self.session: Optional[aiohttp.ClientSession] = None
+        # 연결 풀 설정 (api.telegram.org 단일 호스트, 유휴 연결을 오래 유지해 TLS 재연결 방지)
+        self._connector_kwargs: Dict[str, Any] = dict(
+            limit=0,
+            limit_per_host=32,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
 
         # 메시지 전송 제한 (초당 최대 30개)
         self.rate_limit_delay = 0.034  # 1/30초
@@ -48,7 +56,8 @@ class TelegramBot:
         """세션 확보"""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(**self._connector_kwargs)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
         return self.session
 
     async def _make_request(
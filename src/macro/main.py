@@ -1,4 +1,6 @@
 import sys
+import logging
+import traceback
 from pathlib import Path
 from typing import Optional
 
@@ -99,6 +101,11 @@ def setup_directories():
 
 
 def main():
+    # 기본 로그 레벨은 INFO (실행 중 세부 로그는 DEBUG)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
     setup_directories()
     app = setup_application()
     # 스플래시 스크린 표시
@@ -139,8 +146,6 @@ def cli_main():
         print("\n애플리케이션이 중단되었습니다.")
         sys.exit(0)
     except Exception as e:
-        import traceback
-
         traceback.print_exc()
         print(f"치명적 오류: {e}")
         sys.exit(1)
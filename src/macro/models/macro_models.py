@@ -318,6 +318,9 @@ class MacroConfig:
     screenshot_save_path: str = "assets/screenshots"
     auto_save_interval: int = 30  # seconds
     match_confidence_threshold: float = 0.7
+    grayscale_matching: bool = False  # 흑백 단일 채널로 매칭 (색 구분이 필요 없을 때)
+    opencl_matching: bool = False  # OpenCL(GPU)로 템플릿 매칭 (지원 환경에서만)
+    direct_type_ascii: bool = False  # 짧은 영문 텍스트를 붙여넣기 대신 키 입력으로 전송
 
     def add_image_template(self, template: ImageTemplate) -> None:
         """이미지 템플릿 추가"""
@@ -349,6 +352,9 @@ class MacroConfig:
             "screenshot_save_path": self.screenshot_save_path,
             "auto_save_interval": self.auto_save_interval,
             "match_confidence_threshold": self.match_confidence_threshold,
+            "grayscale_matching": self.grayscale_matching,
+            "opencl_matching": self.opencl_matching,
+            "direct_type_ascii": self.direct_type_ascii,
         }
 
     @classmethod
@@ -372,12 +378,17 @@ class MacroConfig:
             screenshot_save_path=data.get("screenshot_save_path", "assets/screenshots"),
             auto_save_interval=data.get("auto_save_interval", 30),
             match_confidence_threshold=data.get("match_confidence_threshold", 0.7),
+            grayscale_matching=data.get("grayscale_matching", False),
+            opencl_matching=data.get("opencl_matching", False),
+            direct_type_ascii=data.get("direct_type_ascii", False),
         )
 
     def save_to_file(self, file_path: str) -> None:
         """파일로 저장"""
         path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        # 저장할 때마다 호출되므로 디렉토리가 이미 있으면 mkdir 생략
+        if not path.parent.is_dir():
+            path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(file_path, "w", encoding="utf-8") as f:
             json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
@@ -385,10 +396,10 @@ class MacroConfig:
     @classmethod
     def load_from_file(cls, file_path: str) -> "MacroConfig":
         """파일에서 불러오기"""
-        if not Path(file_path).exists():
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
             return cls()
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
         return cls.from_dict(data)
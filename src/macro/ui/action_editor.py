@@ -2,8 +2,10 @@
 액션 편집기 다이얼로그
 """
 
+import logging
 import uuid
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Dict, Set, Tuple
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -22,16 +24,28 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QTextEdit,
     QWidget,
+    QStackedWidget,
 )
-from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QPoint
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import (
+    pyqtSignal,
+    pyqtSlot,
+    Qt,
+    QTimer,
+    QPoint,
+    QSignalBlocker,
+    QMetaObject,
+)
+from PyQt6.QtGui import QPixmap, QPainter, QPen, QColor
+from PyQt6 import sip
 from macro.models.macro_models import (
     MacroAction,
     ActionType,
     ImageSearchFailureAction,
     ConditionType,
 )
-from macro.core.macro_engine import MacroEngine
+from macro.core.macro_engine import MacroEngine, IMAGE_CONDITION_TYPES
+
+logger = logging.getLogger(__name__)
 
 
 STR_ACTION_MAP = {
@@ -57,6 +71,157 @@ ACTION_STR_MAP = {
     ActionType.IF: "조건문 (IF)",
     ActionType.ELSE: "조건문 (ELSE)",
 }
+# 액션 타입 콤보박스 항목 (표시 순서)
+ACTION_TYPE_ITEMS = [
+    "마우스 클릭",
+    "이미지 클릭",
+    # "더블클릭",
+    # "우클릭",
+    "텍스트 입력",
+    # "키 입력",
+    "스크롤",
+    "대기",
+    "텔레그램 전송",
+    # "조건문 (IF)",
+    # "조건문 (ELSE)",
+]
+ACTION_TYPE_INDEX_MAP = {
+    STR_ACTION_MAP[text]: i for i, text in enumerate(ACTION_TYPE_ITEMS)
+}
+# 이미지 탐색 실패 처리 옵션
+STR_FAILURE_MAP = {
+    "실행 중단": ImageSearchFailureAction.STOP_EXECUTION,
+    "매크로 처음부터 재실행": ImageSearchFailureAction.RESTART_SEQUENCE,
+    "무시하고 다음 단계": ImageSearchFailureAction.SKIP_TO_NEXT,
+}
+FAILURE_STR_MAP = {v: k for k, v in STR_FAILURE_MAP.items()}
+FAILURE_INDEX_MAP = {v: i for i, v in enumerate(STR_FAILURE_MAP.values())}
+# 조건 타입
+STR_CONDITION_MAP = {
+    "이미지 발견": ConditionType.IMAGE_FOUND,
+    "이미지 미발견": ConditionType.IMAGE_NOT_FOUND,
+    "항상 실행": ConditionType.ALWAYS,
+}
+CONDITION_STR_MAP = {v: k for k, v in STR_CONDITION_MAP.items()}
+# 조건 타입 콤보박스 인덱스 (콤보박스는 STR_CONDITION_MAP 순서로 채워짐)
+CONDITION_INDEX_MAP = {v: i for i, v in enumerate(STR_CONDITION_MAP.values())}
+# 스크롤 방향
+STR_SCROLL_DIRECTION_MAP = {
+    "위쪽으로": "up",
+    "아래쪽으로": "down",
+    "왼쪽으로": "left",
+    "오른쪽으로": "right",
+}
+SCROLL_DIRECTION_STR_MAP = {v: k for k, v in STR_SCROLL_DIRECTION_MAP.items()}
+SCROLL_DIRECTION_INDEX_MAP = {
+    v: i for i, v in enumerate(STR_SCROLL_DIRECTION_MAP.values())
+}
+
+# 이미지 위치를 클릭하는 액션 타입 (이미지 + 클릭 위치 필요)
+IMAGE_CLICK_ACTION_TYPES = frozenset({ActionType.IMAGE_CLICK})
+# 이미지 미리보기(오른쪽 패널)를 사용하는 액션 타입
+IMAGE_ACTION_TYPES = IMAGE_CLICK_ACTION_TYPES | {ActionType.IF}
+
+# 경고 메시지
+WARNING_TITLE = "경고"
+NO_IMAGE_WARNING = "먼저 이미지를 캡쳐하세요."
+
+# 액션 편집기 스타일시트 (다이얼로그에 한 번만 적용, objectName으로 선택)
+ACTION_EDITOR_STYLESHEET = """
+QLabel#image_title {
+    font-weight: bold;
+    font-size: 14px;
+    margin-bottom: 10px;
+}
+
+QLabel#large_image_preview {
+    border: 2px solid #dee2e6;
+    background-color: #f8f9fa;
+    border-radius: 8px;
+}
+
+QLabel#click_info_label {
+    color: #6c757d;
+    font-size: 12px;
+    margin-top: 10px;
+}
+
+QLabel#region_info_label {
+    color: #6c757d;
+    font-size: 12px;
+    margin-top: 5px;
+}
+
+QLabel#region_overlay {
+    background-color: rgba(0, 123, 255, 100);
+    border: 2px solid #007bff;
+}
+
+QLabel#info_label {
+    color: #6c757d;
+    font-size: 12px;
+}
+
+QLabel#else_info_label {
+    color: #6c757d;
+    font-style: italic;
+}
+
+QSpinBox#readonly_field, QLineEdit#readonly_field {
+    background-color: #f8f9fa;
+}
+
+QPushButton#success_button {
+    background-color: #28a745;
+    border-color: #28a745;
+    color: white;
+}
+
+QPushButton#success_button:hover:enabled {
+    background-color: #218838;
+    border-color: #1e7e34;
+}
+"""
+
+
+@lru_cache(maxsize=32)
+def _load_pixmap_cached(path: str, mtime_ns: int) -> QPixmap:
+    """템플릿 이미지 파일 디코딩 (경로와 수정 시각으로 캐시)"""
+    return QPixmap(path)
+
+
+class PreviewLabel(QLabel):
+    """클릭 위치 마커를 직접 그리는 이미지 미리보기 라벨"""
+
+    MARKER_RADIUS = 6  # 큰 이미지이므로 마커도 크게
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._marker: Optional[Tuple[int, int]] = None
+
+    def set_marker(self, pos: Optional[Tuple[int, int]]):
+        """마커 중심 위치 설정 (None이면 숨김)"""
+        if pos == self._marker:
+            return
+        self._marker = pos
+        self.update()
+
+    def paintEvent(self, event):
+        """그리기 이벤트"""
+        super().paintEvent(event)
+        if self._marker is None:
+            return
+
+        painter = QPainter(self)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(QColor("#ff0000"))
+            painter.setPen(QPen(QColor("#ffffff"), 2))
+            painter.drawEllipse(
+                QPoint(*self._marker), self.MARKER_RADIUS, self.MARKER_RADIUS
+            )
+        finally:
+            painter.end()
 
 
 class ActionEditor(QDialog):
@@ -73,20 +238,70 @@ class ActionEditor(QDialog):
         self.action = None
         self.current_template_id: Optional[str] = None
         self.captured_keys: List[str] = []
+        # 편집 중 상태 (액션 타입을 바꿔도 유지됨)
+        self.current_pixmap: Optional[QPixmap] = None
+        self.selected_click_position: Optional[Tuple[int, int]] = None
+        self.selected_region: Optional[Tuple[int, int, int, int]] = None
 
         # UI 요소들
         self.action_type_combo: Optional[QComboBox] = None
         self.settings_group: Optional[QGroupBox] = None
         self.settings_layout: Optional[QVBoxLayout] = None
-
-        # 현재 상태 보존을 위한 변수들
-        self._preserved_state: dict = {}
+        self.settings_stack: Optional[QStackedWidget] = None
+
+        # 액션 타입별 설정 패널 캐시 (최초 사용 시 생성 후 재사용)
+        self._panels: Dict[ActionType, QWidget] = {}
+        # 현재 편집 대상 액션 값이 로드된 패널들
+        self._loaded_panels: Set[ActionType] = set()
+        # 현재 표시 중인 패널의 액션 타입
+        self._current_action_type: Optional[ActionType] = None
+
+        # 오른쪽 이미지 미리보기 패널 (필요할 때 생성)
+        self.right_panel: Optional[QWidget] = None
+        self.image_title: Optional[QLabel] = None
+        self.large_image_preview: Optional[PreviewLabel] = None
+        self.click_info_label: Optional[QLabel] = None
+        self.region_info_label: Optional[QLabel] = None
+
+        # 여러 패널에서 참조하는 위젯들 (해당 패널 생성 시 설정)
+        self.click_x_spin: Optional[QSpinBox] = None
+        self.click_y_spin: Optional[QSpinBox] = None
+        self.failure_action_combo: Optional[QComboBox] = None
+        self.condition_type_combo: Optional[QComboBox] = None
+        self.condition_image_input: Optional[QLineEdit] = None
+        self.condition_capture_btn: Optional[QPushButton] = None
+
+        # 미리보기용 스케일된 픽스맵 캐시 ((template_id, 너비, 높이) -> QPixmap)
+        self._scaled_cache: Dict[Tuple[str, int, int], QPixmap] = {}
+        # 라벨 내 실제 이미지 표시 영역 캐시 (라벨/픽스맵 크기가 같으면 재사용)
+        self._display_rect_key: Optional[Tuple[int, int, int, int]] = None
+        self._display_rect: Optional[Tuple[int, int, int, int]] = None
+        # 현재 미리보기에 표시 중인 템플릿 ID (같은 템플릿 재로드 생략용)
+        self._displayed_template_id: Optional[str] = None
+
+        # 크기 변경이 끝난 뒤 미리보기를 부드럽게 다시 스케일하기 위한 타이머
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(60)
+        self._resize_timer.timeout.connect(self._rescale_preview)
 
         # 영역 선택을 위한 변수들
         self.is_dragging = False
         self.drag_start_pos = None
         self.region_overlay = None
 
+        # 액션 타입별 저장 처리 (ELSE는 별도 설정이 없으므로 생략)
+        self._save_handlers = {
+            ActionType.CLICK: self._save_click_action,
+            ActionType.IMAGE_CLICK: self._save_image_click_action,
+            ActionType.TYPE_TEXT: self._save_text_action,
+            ActionType.KEY_PRESS: self._save_key_action,
+            ActionType.SCROLL: self._save_scroll_action,
+            ActionType.WAIT: self._save_wait_action,
+            ActionType.SEND_TELEGRAM: self._save_telegram_action,
+            ActionType.IF: self._save_if_action,
+        }
+
         self.is_edit_mode = False
         self.init_ui()
         self.setup_connections()
@@ -97,6 +312,7 @@ class ActionEditor(QDialog):
         self.setWindowTitle(title)
         self.setModal(True)
         self.resize(800, 600)  # 더 큰 창 크기
+        self.setStyleSheet(ACTION_EDITOR_STYLESHEET)
 
         # 메인 레이아웃 (수평 분할)
         main_layout = QHBoxLayout(self)
@@ -126,27 +342,25 @@ class ActionEditor(QDialog):
         type_group.setMaximumHeight(120)  # 최대 높이 지정
 
         self.action_type_combo = QComboBox()
-        self.action_type_combo.addItems(
-            [
-                "마우스 클릭",
-                "이미지 클릭",
-                # "더블클릭",
-                # "우클릭",
-                "텍스트 입력",
-                # "키 입력",
-                "스크롤",
-                "대기",
-                "텔레그램 전송",
-                # "조건문 (IF)",
-                # "조건문 (ELSE)",
-            ]
-        )
+        # 항목 데이터로 ActionType을 함께 저장 (선택 시 텍스트 매핑 불필요)
+        for text in ACTION_TYPE_ITEMS:
+            self.action_type_combo.addItem(text, STR_ACTION_MAP[text])
         type_layout.addRow("타입:", self.action_type_combo)
         layout.addWidget(type_group)
 
         # 액션 설정
         self.settings_group = QGroupBox("액션 설정")
         self.settings_layout = QVBoxLayout(self.settings_group)
+
+        # 액션 타입별 설정 패널 (타입 변경 시 패널 전환만 수행)
+        self.settings_stack = QStackedWidget(self.settings_group)
+        self.settings_layout.addWidget(self.settings_stack)
+
+        # 공통 설정
+        self.enabled_check = QCheckBox("활성화")
+        self.enabled_check.setChecked(True)
+        self.settings_layout.addWidget(self.enabled_check)
+
         layout.addWidget(self.settings_group)
 
         # 버튼들
@@ -165,24 +379,24 @@ class ActionEditor(QDialog):
         # 왼쪽 패널을 메인 레이아웃에 추가
         main_layout.addWidget(left_panel)
 
+    def _ensure_right_panel(self):
+        """오른쪽 이미지 미리보기 패널 생성 (이미지 액션을 처음 선택할 때 생성)"""
+        if self.right_panel is not None:
+            return
+
         # 오른쪽 패널 (이미지 미리보기)
         self.right_panel = QWidget()
         right_layout = QVBoxLayout(self.right_panel)
 
         # 이미지 미리보기 제목
         self.image_title = QLabel("이미지 미리보기 및 클릭 위치 설정")
-        self.image_title.setStyleSheet(
-            "font-weight: bold; font-size: 14px; margin-bottom: 10px;"
-        )
+        self.image_title.setObjectName("image_title")
         right_layout.addWidget(self.image_title)
 
-        self.current_template_id = None
         # 이미지 미리보기 라벨 (오른쪽 패널 전체 사용)
-        self.large_image_preview = QLabel()
+        self.large_image_preview = PreviewLabel()
         self.large_image_preview.setMinimumSize(400, 300)
-        self.large_image_preview.setStyleSheet(
-            "border: 2px solid #dee2e6; background-color: #f8f9fa; border-radius: 8px;"
-        )
+        self.large_image_preview.setObjectName("large_image_preview")
         self.large_image_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.large_image_preview.setText(
             "이미지를 캡쳐하면 여기에 표시됩니다.\n클릭할 위치를 선택하세요.\nShift+드래그로 영역을 선택할 수 있습니다."
@@ -199,36 +413,43 @@ class ActionEditor(QDialog):
 
         # 클릭 위치 정보 표시
         self.click_info_label = QLabel("클릭 위치: 미설정")
-        self.click_info_label.setStyleSheet(
-            "color: #6c757d; font-size: 12px; margin-top: 10px;"
-        )
+        self.click_info_label.setObjectName("click_info_label")
         right_layout.addWidget(self.click_info_label)
 
         # 영역 선택 정보 표시
         self.region_info_label = QLabel("선택 영역: 없음")
-        self.region_info_label.setStyleSheet(
-            "color: #6c757d; font-size: 12px; margin-top: 5px;"
-        )
+        self.region_info_label.setObjectName("region_info_label")
         right_layout.addWidget(self.region_info_label)
 
-        main_layout.addWidget(self.right_panel)
+        self.layout().addWidget(self.right_panel)
 
     def init_ui_values(self):
         title = "액션 편집" if self.is_edit_mode else "액션 추가"
         self.setWindowTitle(title)
 
         self.description_input.setText("")
-        self.action_type_combo.setCurrentText("마우스 클릭")
+        # 설정 UI는 load_action_data에서 한 번만 갱신하므로 시그널을 막음
+        with QSignalBlocker(self.action_type_combo):
+            self.action_type_combo.setCurrentIndex(
+                ACTION_TYPE_INDEX_MAP[ActionType.CLICK]
+            )
 
         self.current_template_id = None
+        self.current_pixmap = None
+        self.selected_click_position = None
+        self.selected_region = None
+        self.captured_keys = []
+        self._displayed_template_id = None
+        if self.right_panel is None:
+            return
+
         self.large_image_preview.setPixmap(QPixmap())
         self.large_image_preview.setText(
             "이미지를 캡쳐하면 여기에 표시됩니다.\n클릭할 위치를 선택하세요.\nShift+드래그로 영역을 선택할 수 있습니다."
         )
-        if hasattr(self, "region_overlay") and self.region_overlay:
+        if self.region_overlay:
             self.region_overlay.hide()
-        if hasattr(self, "large_position_marker") and self.large_position_marker:
-            self.large_position_marker.hide()
+        self.large_image_preview.set_marker(None)
 
         self.click_info_label.setVisible(False)
         self.region_info_label.setText("선택 영역: 없음")
@@ -236,7 +457,38 @@ class ActionEditor(QDialog):
 
     def setup_connections(self):
         """신호 연결"""
-        self.action_type_combo.currentTextChanged.connect(self.on_action_type_changed)
+        self.action_type_combo.currentTextChanged.connect(
+            self.on_action_type_changed, Qt.ConnectionType.UniqueConnection
+        )
+
+    def resizeEvent(self, event):
+        """크기 변경 시 미리보기 재스케일 (변경 중에는 빠른 변환, 끝나면 부드러운 변환)"""
+        super().resizeEvent(event)
+
+        if self.right_panel is None or not self.right_panel.isVisible():
+            return
+        if not self.current_pixmap:
+            return
+
+        # 크기가 바뀌었으므로 이전 크기의 스케일 캐시는 더 이상 쓰이지 않음
+        self._scaled_cache.clear()
+        self.large_image_preview.setPixmap(
+            self.current_pixmap.scaled(
+                self.large_image_preview.size(),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation,
+            )
+        )
+        self._resize_timer.start()
+
+    def _rescale_preview(self):
+        """크기 변경이 끝난 뒤 미리보기를 부드러운 변환으로 다시 스케일"""
+        if not self.current_template_id or not self._is_dialog_valid():
+            return
+        # 크기가 바뀌었으므로 같은 템플릿이라도 다시 스케일해야 함
+        self._displayed_template_id = None
+        self.load_template_image(self.current_template_id)
+        self.update_large_click_position_marker()
 
     def on_cancel(self):
         """취소 버튼 클릭 시"""
@@ -244,400 +496,387 @@ class ActionEditor(QDialog):
 
     def on_action_type_changed(self):
         """액션 타입 변경 시"""
-        # 현재 템플릿 정보 임시 보존
-        preserved_template_id = getattr(self, "current_template_id", None)
-        preserved_click_position = getattr(self, "selected_click_position", None)
-
-        self.update_settings_ui()
-        # 템플릿 정보 복원 (액션 타입이 이미지 사용 타입인 경우)
+        previous_type = self._current_action_type
         action_type = self.get_selected_action_type()
-        if action_type in [
-            ActionType.IMAGE_CLICK,
-            ActionType.IF,
-        ]:
-            if preserved_template_id:
-                self.current_template_id = preserved_template_id
-                # 이미지 다시 로드
-                QTimer.singleShot(
-                    50, lambda: self._safe_load_template_image(preserved_template_id)
-                )
-
-            if preserved_click_position and action_type in [
-                ActionType.IMAGE_CLICK,
-            ]:
-                self.selected_click_position = preserved_click_position
-                # 클릭 위치 복원
-                QTimer.singleShot(100, self._restore_click_position_after_type_change)
+        if action_type == previous_type:
+            return
 
+        # 패널별 위젯 상태와 템플릿/클릭 위치는 그대로 유지되므로 패널 전환만 수행
         self.update_settings_ui()
 
+        # 오른쪽 패널이 새로 표시될 때만 미리보기 크기가 바뀔 수 있으므로 갱신
+        if (
+            action_type in IMAGE_ACTION_TYPES
+            and previous_type not in IMAGE_ACTION_TYPES
+        ):
+            self._queue_template_preview_refresh()
+
     def update_settings_ui(self):
-        """설정 UI 업데이트 - self.action 값이 있으면 해당 값으로 설정, 없으면 기본값으로 설정"""
-        # 기존 위젯들 안전하게 제거
-        for i in reversed(range(self.settings_layout.count())):
-            child = self.settings_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
-                self.settings_layout.removeWidget(child)
+        """설정 UI 업데이트 - 선택된 액션 타입의 패널을 표시 (패널은 최초 사용 시 생성 후 재사용)
 
+        사용자 선택 시에는 on_action_type_changed에서, 프로그램에 의한 선택
+        (load_action_data) 시에는 시그널을 막은 뒤 직접 한 번만 호출된다.
+        """
         action_type = self.get_selected_action_type()
         if not action_type:
             return
 
-        # 오른쪽 패널 표시/숨김 결정 (이미지를 사용하는 액션들)
-        is_image_action = action_type in [
-            ActionType.IMAGE_CLICK,
-            ActionType.IF,  # IF 액션도 이미지 사용
-        ]
-
-        if hasattr(self, "right_panel"):
-            self.right_panel.setVisible(is_image_action)
-
-            # 오른쪽 패널 제목과 텍스트를 액션 타입에 맞게 업데이트
-            if is_image_action:
-                if action_type == ActionType.IF:
-                    # IF 액션: 클릭 위치 설정 불필요
-                    if hasattr(self, "image_title"):
-                        self.image_title.setText("조건 이미지 미리보기")
-                    if hasattr(self, "large_image_preview") and not hasattr(
-                        self, "current_template_id"
-                    ):
-                        self.large_image_preview.setText(
-                            "조건 확인에 사용할 이미지를 캡쳐하세요."
-                        )
-                    if hasattr(self, "click_info_label"):
-                        self.click_info_label.setVisible(False)
-                else:
-                    # 클릭 액션들: 클릭 위치 설정 필요
-                    if hasattr(self, "image_title"):
-                        self.image_title.setText("이미지 미리보기 및 클릭 위치 설정")
-                    if hasattr(self, "large_image_preview") and not hasattr(
-                        self, "current_template_id"
-                    ):
-                        self.large_image_preview.setText(
-                            "이미지를 캡쳐하면 여기에 표시됩니다.\n클릭할 위치를 선택하세요."
-                        )
-                    if hasattr(self, "click_info_label"):
-                        self.click_info_label.setVisible(True)
+        self._sync_right_panel(action_type)
 
-        form_layout = QFormLayout()
+        panel = self._panels.get(action_type)
+        if panel is None:
+            panel = self._build_panel(action_type)
+            self._panels[action_type] = panel
+            self.settings_stack.addWidget(panel)
 
-        if action_type == ActionType.CLICK:
-            # 좌표 표시
-            self.click_x_spin = QSpinBox()
-            self.click_x_spin.setRange(0, 9999)
-            self.click_x_spin.setReadOnly(True)
-            self.click_x_spin.setStyleSheet("background-color: #f8f9fa;")
-            form_layout.addRow("X 좌표:", self.click_x_spin)
-
-            self.click_y_spin = QSpinBox()
-            self.click_y_spin.setRange(0, 9999)
-            self.click_y_spin.setReadOnly(True)
-            self.click_y_spin.setStyleSheet("background-color: #f8f9fa;")
-            form_layout.addRow("Y 좌표:", self.click_y_spin)
-
-            # 마우스 위치 캡쳐 버튼
-            self.mouse_capture_btn = QPushButton("마우스 위치 캡쳐")
-            self.mouse_capture_btn.setObjectName("success_button")
-            self.mouse_capture_btn.clicked.connect(self.request_mouse_capture)
-            form_layout.addRow("위치 캡쳐:", self.mouse_capture_btn)
-
-            # 안내 텍스트
-            mouse_info_label = QLabel(
-                "※ 버튼을 클릭하면 전체화면 오버레이가 표시됩니다"
+        # 편집 대상 액션이 바뀐 뒤 처음 표시되는 패널이면 값 로드
+        if action_type not in self._loaded_panels:
+            self._load_panel_values(action_type)
+            self._loaded_panels.add(action_type)
+
+        self.settings_stack.setCurrentWidget(panel)
+        self._current_action_type = action_type
+
+    def _sync_right_panel(self, action_type: ActionType):
+        """오른쪽 패널 표시 여부와 제목/안내 문구를 액션 타입에 맞게 갱신"""
+        if action_type not in IMAGE_ACTION_TYPES:
+            if self.right_panel is not None:
+                self.right_panel.setVisible(False)
+            return
+
+        self._ensure_right_panel()
+        self.right_panel.setVisible(True)
+
+        # 클릭 액션만 클릭 위치 설정이 필요 (IF 액션은 조건 이미지만 표시)
+        show_click = action_type in IMAGE_CLICK_ACTION_TYPES
+        self.image_title.setText(
+            "이미지 미리보기 및 클릭 위치 설정" if show_click else "조건 이미지 미리보기"
+        )
+        self.click_info_label.setVisible(show_click)
+        if not self.current_template_id:
+            self.large_image_preview.setText(
+                "이미지를 캡쳐하면 여기에 표시됩니다.\n클릭할 위치를 선택하세요."
+                if show_click
+                else "조건 확인에 사용할 이미지를 캡쳐하세요."
             )
-            mouse_info_label.setStyleSheet("color: #6c757d; font-size: 12px;")
-            form_layout.addRow(mouse_info_label)
 
+    def _build_panel(self, action_type: ActionType) -> QWidget:
+        """액션 타입별 설정 패널 생성 (타입당 한 번만 호출됨)"""
+        panel = QWidget(self.settings_stack)
+        form_layout = QFormLayout(panel)
+
+        if action_type == ActionType.CLICK:
+            self._build_click_panel(form_layout)
+        elif action_type == ActionType.IMAGE_CLICK:
+            self._build_image_click_panel(form_layout)
+        elif action_type == ActionType.TYPE_TEXT:
+            self._build_text_panel(form_layout)
+        elif action_type == ActionType.KEY_PRESS:
+            self._build_key_panel(form_layout)
+        elif action_type == ActionType.SCROLL:
+            self._build_scroll_panel(form_layout)
+        elif action_type == ActionType.WAIT:
+            self._build_wait_panel(form_layout)
+        elif action_type == ActionType.SEND_TELEGRAM:
+            self._build_telegram_panel(form_layout)
+        elif action_type == ActionType.IF:
+            self._build_if_panel(form_layout)
+        elif action_type == ActionType.ELSE:
+            self._build_else_panel(form_layout)
+
+        return panel
+
+    def _build_click_panel(self, form_layout: QFormLayout):
+        """마우스 클릭 설정 패널"""
+        # 좌표 표시
+        self.click_x_spin = QSpinBox()
+        self.click_x_spin.setRange(0, 9999)
+        self.click_x_spin.setReadOnly(True)
+        self.click_x_spin.setObjectName("readonly_field")
+        form_layout.addRow("X 좌표:", self.click_x_spin)
+
+        self.click_y_spin = QSpinBox()
+        self.click_y_spin.setRange(0, 9999)
+        self.click_y_spin.setReadOnly(True)
+        self.click_y_spin.setObjectName("readonly_field")
+        form_layout.addRow("Y 좌표:", self.click_y_spin)
+
+        # 마우스 위치 캡쳐 버튼
+        self.mouse_capture_btn = QPushButton("마우스 위치 캡쳐")
+        self.mouse_capture_btn.setObjectName("success_button")
+        self.mouse_capture_btn.clicked.connect(
+            self.request_mouse_capture, Qt.ConnectionType.UniqueConnection
+        )
+        form_layout.addRow("위치 캡쳐:", self.mouse_capture_btn)
+
+        # 안내 텍스트
+        mouse_info_label = QLabel("※ 버튼을 클릭하면 전체화면 오버레이가 표시됩니다")
+        mouse_info_label.setObjectName("info_label")
+        form_layout.addRow(mouse_info_label)
+
+    def _build_image_click_panel(self, form_layout: QFormLayout):
+        """이미지 클릭 설정 패널"""
+        # 안내 텍스트
+        self.coordinate_info_label = QLabel(
+            "※ 좌표는 우측 이미지를 좌클릭하여 설정하세요"
+        )
+        self.coordinate_info_label.setObjectName("info_label")
+        form_layout.addRow(self.coordinate_info_label)
+
+        # 캡쳐 버튼
+        self.capture_btn = QPushButton("이미지 캡쳐")
+        self.capture_btn.setObjectName("success_button")
+        self.capture_btn.clicked.connect(
+            self.start_capture, Qt.ConnectionType.UniqueConnection
+        )
+        form_layout.addRow("이미지 캡쳐:", self.capture_btn)
+
+        # 이미지 탐색 실패 시 처리 옵션
+        self.failure_action_combo = QComboBox()
+        for text, failure_action in STR_FAILURE_MAP.items():
+            self.failure_action_combo.addItem(text, failure_action)
+        form_layout.addRow("이미지 탐색 실패 시:", self.failure_action_combo)
+
+    def _build_text_panel(self, form_layout: QFormLayout):
+        """텍스트 입력 설정 패널"""
+        self.text_input = QTextEdit()
+        self.text_input.setMaximumHeight(100)
+        form_layout.addRow("입력할 텍스트:", self.text_input)
+
+    def _build_key_panel(self, form_layout: QFormLayout):
+        """키 입력 설정 패널"""
+        # 키 입력 캡처를 위한 위젯
+        self.key_input_widget = QWidget()
+        key_input_layout = QHBoxLayout(self.key_input_widget)
+
+        self.key_input = QLineEdit()
+        self.key_input.setPlaceholderText("키를 눌러 입력하세요")
+        self.key_input.setReadOnly(True)  # 직접 입력 방지
+        self.key_input.setObjectName("readonly_field")
+        key_input_layout.addWidget(self.key_input)
+
+        # 키 캡처 버튼
+        self.capture_key_btn = QPushButton("키 입력")
+        self.capture_key_btn.clicked.connect(
+            self.start_key_capture, Qt.ConnectionType.UniqueConnection
+        )
+        key_input_layout.addWidget(self.capture_key_btn)
+
+        # 초기화 버튼
+        self.clear_key_btn = QPushButton("초기화")
+        self.clear_key_btn.clicked.connect(
+            self.clear_key_input, Qt.ConnectionType.UniqueConnection
+        )
+        key_input_layout.addWidget(self.clear_key_btn)
+
+        form_layout.addRow("키 조합:", self.key_input_widget)
+
+    def _build_scroll_panel(self, form_layout: QFormLayout):
+        """스크롤 설정 패널"""
+        # 스크롤 방향 선택
+        self.scroll_direction_combo = QComboBox()
+        for text, direction in STR_SCROLL_DIRECTION_MAP.items():
+            self.scroll_direction_combo.addItem(text, direction)
+        form_layout.addRow("스크롤 방향:", self.scroll_direction_combo)
+
+        # 스크롤 픽셀 수
+        self.scroll_amount_spin = QSpinBox()
+        self.scroll_amount_spin.setRange(1, 100)
+        self.scroll_amount_spin.setSuffix(" 회")
+        form_layout.addRow("스크롤 횟수:", self.scroll_amount_spin)
+
+        # 안내 텍스트
+        scroll_info_label = QLabel("※ 마우스 휠이나 페이지 스크롤을 시뮬레이션합니다")
+        scroll_info_label.setObjectName("info_label")
+        form_layout.addRow(scroll_info_label)
+
+    def _build_wait_panel(self, form_layout: QFormLayout):
+        """대기 설정 패널"""
+        self.wait_seconds = QDoubleSpinBox()
+        self.wait_seconds.setRange(0.1, 60.0)
+        self.wait_seconds.setSuffix(" 초")
+        form_layout.addRow("대기 시간:", self.wait_seconds)
+
+    def _build_telegram_panel(self, form_layout: QFormLayout):
+        """텔레그램 전송 설정 패널"""
+        self.telegram_message = QTextEdit()
+        self.telegram_message.setMaximumHeight(100)
+        form_layout.addRow("메시지:", self.telegram_message)
+
+    def _build_if_panel(self, form_layout: QFormLayout):
+        """조건문 (IF) 설정 패널"""
+        # 조건 타입 선택
+        self.condition_type_combo = QComboBox()
+        for text, condition_type in STR_CONDITION_MAP.items():
+            self.condition_type_combo.addItem(text, condition_type)
+        form_layout.addRow("조건 타입:", self.condition_type_combo)
+
+        # 조건 이미지 선택 (이미지 기반 조건일 때만)
+        condition_image_widget = QWidget()
+        condition_image_layout = QHBoxLayout(condition_image_widget)
+
+        self.condition_image_input = QLineEdit()
+        self.condition_image_input.setPlaceholderText("조건 확인에 사용할 이미지")
+        self.condition_image_input.setReadOnly(True)
+        condition_image_layout.addWidget(self.condition_image_input)
+
+        self.condition_capture_btn = QPushButton("이미지 캡쳐")
+        self.condition_capture_btn.clicked.connect(
+            self.start_capture, Qt.ConnectionType.UniqueConnection
+        )
+        condition_image_layout.addWidget(self.condition_capture_btn)
+
+        form_layout.addRow("조건 이미지:", condition_image_widget)
+
+        # 조건 타입 변경 시 이미지 선택 활성화/비활성화
+        self.condition_type_combo.currentTextChanged.connect(
+            self.on_condition_type_changed, Qt.ConnectionType.UniqueConnection
+        )
+
+    def _build_else_panel(self, form_layout: QFormLayout):
+        """조건문 (ELSE) 설정 패널"""
+        # ELSE는 별도 설정이 필요 없음
+        info_label = QLabel("ELSE 조건은 앞의 IF 조건이 거짓일 때 실행됩니다.")
+        info_label.setObjectName("else_info_label")
+        form_layout.addRow(info_label)
+
+    def _load_panel_values(self, action_type: ActionType):
+        """패널 위젯에 self.action 값 설정 (없으면 기본값)"""
+        if action_type == ActionType.CLICK:
             # 액션 데이터가 있으면 클릭 위치 설정
             if self.action and self.action.click_position:
                 self.click_x_spin.setValue(self.action.click_position[0])
                 self.click_y_spin.setValue(self.action.click_position[1])
                 self.selected_click_position = self.action.click_position
+            else:
+                self.click_x_spin.setValue(0)
+                self.click_y_spin.setValue(0)
 
-        if action_type in [
-            ActionType.IMAGE_CLICK,
-        ]:
-            # 안내 텍스트
-            self.coordinate_info_label = QLabel(
-                "※ 좌표는 우측 이미지를 좌클릭하여 설정하세요"
-            )
-            self.coordinate_info_label.setStyleSheet("color: #6c757d; font-size: 12px;")
-            form_layout.addRow(self.coordinate_info_label)
-
-            # 캡쳐 버튼
-            self.capture_btn = QPushButton("이미지 캡쳐")
-            self.capture_btn.setObjectName("success_button")
-            self.capture_btn.clicked.connect(self.start_capture)
-            form_layout.addRow("이미지 캡쳐:", self.capture_btn)
-
-            # 이미지 탐색 실패 시 처리 옵션
-            self.failure_action_combo = QComboBox()
-            self.failure_action_combo.addItems(
-                [
-                    "실행 중단",
-                    "매크로 처음부터 재실행",
-                    "무시하고 다음 단계",
-                ]
-            )
-            form_layout.addRow("이미지 탐색 실패 시:", self.failure_action_combo)
-
-            # 액션 데이터가 있으면 설정값 로드
-            if self.action:
-                # 실패 처리 옵션 설정
-                if hasattr(self.action, "on_image_not_found"):
+        elif action_type == ActionType.IMAGE_CLICK:
+            # 실패 처리 옵션 설정
+            with QSignalBlocker(self.failure_action_combo):
+                if self.action:
                     self.set_failure_action(self.action.on_image_not_found)
                 else:
-                    self.failure_action_combo.setCurrentText("실행 중단")
-
-                # 이미지 템플릿 로드
-                if self.action.image_template_id:
-                    self.current_template_id = self.action.image_template_id
-                    self.load_template_image(self.action.image_template_id)
-
-                    # 클릭 위치 설정
-                    if self.action.click_position:
-                        self.selected_click_position = self.action.click_position
-                        self.update_large_click_position_marker()
-                        if hasattr(self, "click_info_label"):
-                            x, y = self.action.click_position
-                            self.click_info_label.setText(f"클릭 위치: ({x}, {y})")
-
-                    # 선택된 영역 정보 로드
-                    if self.action.selected_region:
-                        x1, y1, x2, y2 = self.action.selected_region
-                        width = x2 - x1
-                        height = y2 - y1
-                        self.region_info_label.setText(
-                            f"선택 영역: ({x1}, {y1}) ~ ({x2}, {y2}) [{width}x{height}]"
-                        )
-                        # 이미지 좌표를 라벨 좌표로 변환
-                        start_label_pos = self.convert_image_pos_to_label_pos((x1, y1))
-                        end_label_pos = self.convert_image_pos_to_label_pos((x2, y2))
-
-                        if start_label_pos and end_label_pos:
-                            self.update_region_overlay(
-                                QPoint(start_label_pos[0], start_label_pos[1]),
-                                QPoint(end_label_pos[0], end_label_pos[1]),
-                            )
-                        else:
-                            self.hide_region_overlay()
-                    else:
-                        self.hide_region_overlay()
-                        self.region_info_label.setText("선택 영역: 없음")
-            else:
-                # 기본값 설정
-                self.failure_action_combo.setCurrentText("실행 중단")
+                    # 기본값 설정
+                    self.set_failure_action(ImageSearchFailureAction.STOP_EXECUTION)
 
         elif action_type == ActionType.TYPE_TEXT:
-            self.text_input = QTextEdit()
-            self.text_input.setMaximumHeight(100)
-            form_layout.addRow("입력할 텍스트:", self.text_input)
-
             # 액션 데이터가 있으면 텍스트 설정
-            if self.action and hasattr(self.action, "text_input"):
+            if self.action:
                 self.text_input.setPlainText(self.action.text_input or "")
+            else:
+                self.text_input.clear()
 
         elif action_type == ActionType.KEY_PRESS:
-            # 키 입력 캡처를 위한 위젯
-            self.key_input_widget = QWidget()
-            key_input_layout = QHBoxLayout(self.key_input_widget)
-
-            self.key_input = QLineEdit()
-            self.key_input.setPlaceholderText("키를 눌러 입력하세요")
-            self.key_input.setReadOnly(True)  # 직접 입력 방지
-            self.key_input.setStyleSheet("background-color: #f8f9fa;")
-            key_input_layout.addWidget(self.key_input)
-
-            # 키 캡처 버튼
-            self.capture_key_btn = QPushButton("키 입력")
-            self.capture_key_btn.clicked.connect(self.start_key_capture)
-            key_input_layout.addWidget(self.capture_key_btn)
-
-            # 초기화 버튼
-            self.clear_key_btn = QPushButton("초기화")
-            self.clear_key_btn.clicked.connect(self.clear_key_input)
-            key_input_layout.addWidget(self.clear_key_btn)
-
-            form_layout.addRow("키 조합:", self.key_input_widget)
-
             # 액션 데이터가 있으면 키 조합 설정
-            if self.action and hasattr(self.action, "key_combination"):
-                keys = self.action.key_combination or []
-                self.key_input.setText("+".join(keys))
-                if keys:
-                    self.captured_keys = keys
+            keys = (self.action.key_combination if self.action else None) or []
+            self.key_input.setText("+".join(keys))
+            self.captured_keys = keys
 
         elif action_type == ActionType.SCROLL:
-            # 스크롤 방향 선택
-            self.scroll_direction_combo = QComboBox()
-            self.scroll_direction_combo.addItems(
-                ["위쪽으로", "아래쪽으로", "왼쪽으로", "오른쪽으로"]
-            )
-            form_layout.addRow("스크롤 방향:", self.scroll_direction_combo)
-
-            # 스크롤 픽셀 수
-            self.scroll_amount_spin = QSpinBox()
-            self.scroll_amount_spin.setRange(1, 100)
-            self.scroll_amount_spin.setSuffix(" 회")
-            form_layout.addRow("스크롤 횟수:", self.scroll_amount_spin)
-
-            # 안내 텍스트
-            scroll_info_label = QLabel(
-                "※ 마우스 휠이나 페이지 스크롤을 시뮬레이션합니다"
-            )
-            scroll_info_label.setStyleSheet("color: #6c757d; font-size: 12px;")
-            form_layout.addRow(scroll_info_label)
-
             # 액션 데이터가 있으면 스크롤 설정값 로드
-            if self.action:
-                # 스크롤 방향 설정
-                if (
-                    hasattr(self.action, "scroll_direction")
-                    and self.action.scroll_direction
-                ):
-                    direction_map = {
-                        "up": "위쪽으로",
-                        "down": "아래쪽으로",
-                        "left": "왼쪽으로",
-                        "right": "오른쪽으로",
-                    }
-                    direction_text = direction_map.get(
-                        self.action.scroll_direction, "아래쪽으로"
+            with QSignalBlocker(self.scroll_direction_combo):
+                # 스크롤 방향 설정 (기본값: 아래쪽으로)
+                direction = (
+                    self.action.scroll_direction if self.action else None
+                ) or "down"
+                self.scroll_direction_combo.setCurrentIndex(
+                    SCROLL_DIRECTION_INDEX_MAP.get(
+                        direction, SCROLL_DIRECTION_INDEX_MAP["down"]
                     )
-                    index = self.scroll_direction_combo.findText(direction_text)
-                    if index >= 0:
-                        self.scroll_direction_combo.setCurrentIndex(index)
-                else:
-                    self.scroll_direction_combo.setCurrentText("아래쪽으로")
+                )
 
-                # 스크롤 횟수 설정
-                if hasattr(self.action, "scroll_amount"):
-                    self.scroll_amount_spin.setValue(self.action.scroll_amount or 10)
-                else:
-                    self.scroll_amount_spin.setValue(10)
-            else:
-                # 기본값 설정
-                self.scroll_direction_combo.setCurrentText("아래쪽으로")
-                self.scroll_amount_spin.setValue(10)
+            # 스크롤 횟수 설정
+            self.scroll_amount_spin.setValue(
+                (self.action.scroll_amount or 10) if self.action else 10
+            )
 
         elif action_type == ActionType.WAIT:
-            self.wait_seconds = QDoubleSpinBox()
-            self.wait_seconds.setRange(0.1, 60.0)
-            self.wait_seconds.setSuffix(" 초")
-            form_layout.addRow("대기 시간:", self.wait_seconds)
-
             # 액션 데이터가 있으면 대기 시간 설정
-            if self.action and hasattr(self.action, "wait_seconds"):
+            if self.action:
                 self.wait_seconds.setValue(self.action.wait_seconds or 1.0)
             else:
                 self.wait_seconds.setValue(1.0)
 
         elif action_type == ActionType.SEND_TELEGRAM:
-            self.telegram_message = QTextEdit()
-            self.telegram_message.setMaximumHeight(100)
-            form_layout.addRow("메시지:", self.telegram_message)
-
             # 액션 데이터가 있으면 메시지 설정
-            if self.action and hasattr(self.action, "telegram_message"):
+            if self.action:
                 self.telegram_message.setPlainText(self.action.telegram_message or "")
+            else:
+                self.telegram_message.clear()
 
         elif action_type == ActionType.IF:
-            # 조건 타입 선택
-            self.condition_type_combo = QComboBox()
-            self.condition_type_combo.addItems(
-                ["이미지 발견", "이미지 미발견", "항상 실행"]
-            )
-            form_layout.addRow("조건 타입:", self.condition_type_combo)
-
-            # 조건 이미지 선택 (이미지 기반 조건일 때만)
-            condition_image_widget = QWidget()
-            condition_image_layout = QHBoxLayout(condition_image_widget)
-
-            self.condition_image_input = QLineEdit()
-            self.condition_image_input.setPlaceholderText("조건 확인에 사용할 이미지")
-            self.condition_image_input.setReadOnly(True)
-            condition_image_layout.addWidget(self.condition_image_input)
-
-            self.condition_capture_btn = QPushButton("이미지 캡쳐")
-            self.condition_capture_btn.clicked.connect(self.start_capture)
-            condition_image_layout.addWidget(self.condition_capture_btn)
-
-            form_layout.addRow("조건 이미지:", condition_image_widget)
-
-            # 조건 타입 변경 시 이미지 선택 활성화/비활성화
-            self.condition_type_combo.currentTextChanged.connect(
-                self.on_condition_type_changed
-            )
-
             # 액션 데이터가 있으면 조건 설정값 로드
-            if self.action:
-                # 조건 타입 설정
-                if (
-                    hasattr(self.action, "condition_type")
-                    and self.action.condition_type
-                ):
-                    condition_text_map = {
-                        ConditionType.IMAGE_FOUND: "이미지 발견",
-                        ConditionType.IMAGE_NOT_FOUND: "이미지 미발견",
-                        ConditionType.ALWAYS: "항상 실행",
-                    }
-                    text = condition_text_map.get(
-                        self.action.condition_type, "항상 실행"
+            # (on_condition_type_changed는 아래에서 한 번만 직접 호출)
+            with QSignalBlocker(self.condition_type_combo):
+                condition_type = (
+                    self.action.condition_type if self.action else None
+                ) or ConditionType.ALWAYS
+                self.condition_type_combo.setCurrentIndex(
+                    CONDITION_INDEX_MAP.get(
+                        condition_type, CONDITION_INDEX_MAP[ConditionType.ALWAYS]
                     )
-                    index = self.condition_type_combo.findText(text)
-                    if index >= 0:
-                        self.condition_type_combo.setCurrentIndex(index)
-                else:
-                    self.condition_type_combo.setCurrentText("항상 실행")
+                )
 
-                # 이미지 템플릿 로드
+            if self.action:
+
+                # 조건 이미지 입력 필드에 템플릿 이름 표시
+                template = None
                 if self.action.image_template_id:
-                    self.current_template_id = self.action.image_template_id
-                    self.load_template_image(self.action.image_template_id)
-
-                    # 조건 이미지 입력 필드에 템플릿 이름 표시
-                    if hasattr(self, "engine"):
-                        engine = self.engine
-                        template = engine.config.get_image_template(
-                            self.action.image_template_id
-                        )
-                        if template:
-                            self.condition_image_input.setText(template.name)
+                    template = self.engine.config.get_image_template(
+                        self.action.image_template_id
+                    )
+                self.condition_image_input.setText(template.name if template else "")
             else:
-                # 기본값 설정
-                self.condition_type_combo.setCurrentText("항상 실행")
+                self.condition_image_input.clear()
 
             # 초기 설정 적용
             self.on_condition_type_changed()
 
-        elif action_type == ActionType.ELSE:
-            # ELSE는 별도 설정이 필요 없음
-            info_label = QLabel("ELSE 조건은 앞의 IF 조건이 거짓일 때 실행됩니다.")
-            info_label.setStyleSheet("color: #6c757d; font-style: italic;")
-            form_layout.addRow(info_label)
+    def _load_template_state(self):
+        """편집 대상 액션의 이미지 템플릿, 클릭 위치, 선택 영역 로드"""
+        if not self.action or not self.action.image_template_id:
+            return
+        if self.action.action_type not in IMAGE_ACTION_TYPES:
+            return
 
-        # 공통 설정
-        self.enabled_check = QCheckBox("활성화")
-        form_layout.addRow(self.enabled_check)
+        # 이미지 템플릿 로드
+        self.current_template_id = self.action.image_template_id
+        self.load_template_image(self.action.image_template_id)
 
-        # 액션 데이터가 있으면 활성화 상태 설정
-        if self.action and hasattr(self.action, "enabled"):
-            self.enabled_check.setChecked(self.action.enabled)
-        else:
-            self.enabled_check.setChecked(True)
+        if self.action.action_type not in IMAGE_CLICK_ACTION_TYPES:
+            return
 
-        # 설명 설정 (공통)
-        if hasattr(self, "description_input"):
-            if self.action and hasattr(self.action, "description"):
-                self.description_input.setText(self.action.description or "")
+        # 클릭 위치 설정
+        if self.action.click_position:
+            self.selected_click_position = self.action.click_position
+            self.update_large_click_position_marker()
+            x, y = self.action.click_position
+            self.click_info_label.setText(f"클릭 위치: ({x}, {y})")
+
+        # 선택된 영역 정보 로드
+        if self.action.selected_region:
+            x1, y1, x2, y2 = self.action.selected_region
+            width = x2 - x1
+            height = y2 - y1
+            self.region_info_label.setText(
+                f"선택 영역: ({x1}, {y1}) ~ ({x2}, {y2}) [{width}x{height}]"
+            )
+            # 이미지 좌표를 라벨 좌표로 변환
+            start_label_pos = self.convert_image_pos_to_label_pos((x1, y1))
+            end_label_pos = self.convert_image_pos_to_label_pos((x2, y2))
+
+            if start_label_pos and end_label_pos:
+                self.update_region_overlay(
+                    QPoint(start_label_pos[0], start_label_pos[1]),
+                    QPoint(end_label_pos[0], end_label_pos[1]),
+                )
             else:
-                self.description_input.setText("")
-
-        # 메모리 누수 방지를 위해 제대로 된 부모-자식 관계 설정
-        widget = QWidget(self.settings_group)
-        widget.setLayout(form_layout)
-        self.settings_layout.addWidget(widget)
+                self.hide_region_overlay()
+        else:
+            self.hide_region_overlay()
+            self.region_info_label.setText("선택 영역: 없음")
 
     def start_capture(self):
         """화면 캡쳐 시작"""
@@ -651,16 +890,13 @@ class ActionEditor(QDialog):
 
     def on_condition_type_changed(self):
         """조건 타입 변경 시 처리"""
-        if not hasattr(self, "condition_type_combo"):
+        if self.condition_type_combo is None:
             return
 
-        condition_text = self.condition_type_combo.currentText()
-        is_image_based = condition_text in ["이미지 발견", "이미지 미발견"]
+        is_image_based = self.get_selected_condition_type() in IMAGE_CONDITION_TYPES
 
-        if hasattr(self, "condition_image_input"):
-            self.condition_image_input.setEnabled(is_image_based)
-        if hasattr(self, "condition_capture_btn"):
-            self.condition_capture_btn.setEnabled(is_image_based)
+        self.condition_image_input.setEnabled(is_image_based)
+        self.condition_capture_btn.setEnabled(is_image_based)
 
     def start_key_capture(self):
         """키 입력 캡처 시작"""
@@ -677,8 +913,7 @@ class ActionEditor(QDialog):
     def clear_key_input(self):
         """키 입력 초기화"""
         self.key_input.clear()
-        if hasattr(self, "captured_keys"):
-            self.captured_keys = []
+        self.captured_keys = []
 
     def create_region_overlay(self):
         """영역 선택을 위한 overlay 위젯 생성"""
@@ -687,9 +922,7 @@ class ActionEditor(QDialog):
             self.region_overlay.deleteLater()
 
         self.region_overlay = QLabel(self.large_image_preview)
-        self.region_overlay.setStyleSheet(
-            "background-color: rgba(0, 123, 255, 100); border: 2px solid #007bff;"
-        )
+        self.region_overlay.setObjectName("region_overlay")
         self.region_overlay.hide()
 
     def update_region_overlay(self, start_pos, end_pos):
@@ -714,14 +947,21 @@ class ActionEditor(QDialog):
         if self.region_overlay:
             self.region_overlay.hide()
 
-    def convert_label_pos_to_image_pos(self, label_pos):
-        """라벨 좌표를 이미지 좌표로 변환"""
-        label_size = self.large_image_preview.size()
-
-        if not hasattr(self, "current_pixmap") or not self.current_pixmap:
+    def _compute_display_rect(self) -> Optional[Tuple[int, int, int, int]]:
+        """라벨 안에서 이미지가 실제로 표시되는 영역 (offset_x, offset_y, 너비, 높이)"""
+        if not self.current_pixmap:
             return None
 
+        label_size = self.large_image_preview.size()
         pixmap_size = self.current_pixmap.size()
+        key = (
+            label_size.width(),
+            label_size.height(),
+            pixmap_size.width(),
+            pixmap_size.height(),
+        )
+        if key == self._display_rect_key:
+            return self._display_rect
 
         # 라벨 크기에 맞춰 스케일링된 이미지 크기 계산
         label_ratio = label_size.width() / label_size.height()
@@ -740,6 +980,19 @@ class ActionEditor(QDialog):
             offset_x = (label_size.width() - displayed_width) // 2
             offset_y = 0
 
+        self._display_rect_key = key
+        self._display_rect = (offset_x, offset_y, displayed_width, displayed_height)
+        return self._display_rect
+
+    def convert_label_pos_to_image_pos(self, label_pos):
+        """라벨 좌표를 이미지 좌표로 변환"""
+        display_rect = self._compute_display_rect()
+        if not display_rect:
+            return None
+
+        pixmap_size = self.current_pixmap.size()
+        offset_x, offset_y, displayed_width, displayed_height = display_rect
+
         # 클릭된 위치가 실제 이미지 영역 내부인지 확인
         click_x = label_pos.x() - offset_x
         click_y = label_pos.y() - offset_y
@@ -760,11 +1013,11 @@ class ActionEditor(QDialog):
         if not image_pos or len(image_pos) != 2:
             return None
 
-        label_size = self.large_image_preview.size()
-
-        if not hasattr(self, "current_pixmap") or not self.current_pixmap:
+        display_rect = self._compute_display_rect()
+        if not display_rect:
             return None
 
+        label_size = self.large_image_preview.size()
         pixmap_size = self.current_pixmap.size()
         image_x, image_y = image_pos
 
@@ -774,22 +1027,7 @@ class ActionEditor(QDialog):
         ):
             return None
 
-        # 라벨 크기에 맞춰 스케일링된 이미지 크기 계산
-        label_ratio = label_size.width() / label_size.height()
-        image_ratio = pixmap_size.width() / pixmap_size.height()
-
-        if image_ratio > label_ratio:
-            # 이미지가 더 넓음 - 너비에 맞춤
-            displayed_width = label_size.width()
-            displayed_height = int(displayed_width / image_ratio)
-            offset_x = 0
-            offset_y = (label_size.height() - displayed_height) // 2
-        else:
-            # 이미지가 더 높음 - 높이에 맞춤
-            displayed_height = label_size.height()
-            displayed_width = int(displayed_height * image_ratio)
-            offset_x = (label_size.width() - displayed_width) // 2
-            offset_y = 0
+        offset_x, offset_y, displayed_width, displayed_height = display_rect
 
         # 이미지 좌표를 표시된 이미지 좌표로 변환
         scale_x = displayed_width / pixmap_size.width()
@@ -810,8 +1048,8 @@ class ActionEditor(QDialog):
 
     def on_large_image_preview_mouse_press(self, event):
         """큰 이미지 미리보기 마우스 누름 이벤트"""
-        if not hasattr(self, "current_template_id") or not self.current_template_id:
-            QMessageBox.warning(self, "경고", "먼저 이미지를 캡쳐하세요.")
+        if not self.current_template_id:
+            self._warn(NO_IMAGE_WARNING)
             return
 
         modifiers = event.modifiers()
@@ -871,8 +1109,8 @@ class ActionEditor(QDialog):
 
     def on_large_image_preview_clicked(self, event):
         """큰 이미지 미리보기 클릭 시 (일반 클릭용)"""
-        if not hasattr(self, "current_template_id") or not self.current_template_id:
-            QMessageBox.warning(self, "경고", "먼저 이미지를 캡쳐하세요.")
+        if not self.current_template_id:
+            self._warn(NO_IMAGE_WARNING)
             return
 
         # 클릭된 위치 계산 (이미지 좌표로 변환)
@@ -888,73 +1126,33 @@ class ActionEditor(QDialog):
             self.update_large_click_position_marker()
 
             # 클릭 위치 정보 업데이트
-            if hasattr(self, "click_info_label"):
-                self.click_info_label.setText(f"클릭 위치: ({image_x}, {image_y})")
+            self.click_info_label.setText(f"클릭 위치: ({image_x}, {image_y})")
         else:
             QMessageBox.information(self, "알림", "이미지 영역 내에서 클릭해주세요.")
 
     def update_large_click_position_marker(self):
         """큰 이미지 미리보기의 클릭 위치 마커 업데이트"""
-        if not hasattr(self, "selected_click_position"):
+        if self.right_panel is None:
             return
 
-        # 기존 마커 제거
-        if hasattr(self, "large_position_marker"):
-            self.large_position_marker.hide()
-            self.large_position_marker.deleteLater()
-
-        # 새 마커 생성
-        marker_size = 12  # 큰 이미지이므로 마커도 크게
-        self.large_position_marker = QLabel(self.large_image_preview)
-        self.large_position_marker.setFixedSize(marker_size, marker_size)
-        self.large_position_marker.setStyleSheet(
-            "background-color: #ff0000; border: 2px solid #ffffff; border-radius: 6px;"
-        )
-
         # 마커 위치 설정 (큰 미리보기 크기에 맞게 조정)
-        if hasattr(self, "current_pixmap") and self.current_pixmap:
-            pixmap_size = self.current_pixmap.size()
-            label_size = self.large_image_preview.size()
-
-            # aspect ratio를 고려한 실제 표시 영역 계산
-            label_ratio = label_size.width() / label_size.height()
-            image_ratio = pixmap_size.width() / pixmap_size.height()
-
-            if image_ratio > label_ratio:
-                # 너비에 맞춤
-                displayed_width = label_size.width()
-                displayed_height = int(displayed_width / image_ratio)
-                offset_x = 0
-                offset_y = (label_size.height() - displayed_height) // 2
-            else:
-                # 높이에 맞춤
-                displayed_height = label_size.height()
-                displayed_width = int(displayed_height * image_ratio)
-                offset_x = (label_size.width() - displayed_width) // 2
-                offset_y = 0
-
-            # 마커 위치 계산
-            marker_x = (
-                offset_x
-                + int(
-                    self.selected_click_position[0]
-                    * displayed_width
-                    / pixmap_size.width()
-                )
-                - marker_size // 2
-            )
-            marker_y = (
-                offset_y
-                + int(
-                    self.selected_click_position[1]
-                    * displayed_height
-                    / pixmap_size.height()
-                )
-                - marker_size // 2
-            )
+        display_rect = self._compute_display_rect()
+        if not display_rect or not self.selected_click_position:
+            self.large_image_preview.set_marker(None)
+            return
 
-            self.large_position_marker.move(marker_x, marker_y)
-            self.large_position_marker.show()
+        pixmap_size = self.current_pixmap.size()
+        offset_x, offset_y, displayed_width, displayed_height = display_rect
+
+        # 마커 중심 위치 계산
+        marker_x = offset_x + int(
+            self.selected_click_position[0] * displayed_width / pixmap_size.width()
+        )
+        marker_y = offset_y + int(
+            self.selected_click_position[1] * displayed_height / pixmap_size.height()
+        )
+
+        self.large_image_preview.set_marker((marker_x, marker_y))
 
     def update_click_position_marker(self):
         """기존 작은 이미지 미리보기의 클릭 위치 마커 업데이트 (호환성 유지)"""
@@ -963,37 +1161,65 @@ class ActionEditor(QDialog):
 
     def load_template_image(self, template_id: str):
         """템플릿 이미지 로드 및 표시"""
-        print(f"템플릿 이미지 로드 및 표시: {template_id}")
+        # 이미 같은 템플릿이 표시 중이면 다시 읽고 스케일할 필요 없음
+        if (
+            template_id == self._displayed_template_id
+            and self.current_pixmap is not None
+        ):
+            return
+
+        logger.debug("템플릿 이미지 로드 및 표시: %s", template_id)
+        self._ensure_right_panel()
+        self._displayed_template_id = None
         try:
             engine = self.engine
             template = engine.config.get_image_template(template_id)
 
-            if template and template.file_path and Path(template.file_path).exists():
-                pixmap = QPixmap(template.file_path)
-                if not pixmap.isNull():
+            pixmap = None
+            if template and template.file_path:
+                try:
+                    # 파일이 바뀌지 않았다면 디코딩된 픽스맵을 재사용
+                    mtime_ns = Path(template.file_path).stat().st_mtime_ns
+                    pixmap = _load_pixmap_cached(template.file_path, mtime_ns)
+                except FileNotFoundError:
+                    pixmap = None
+
+                if pixmap is not None and not pixmap.isNull():
                     # 원본 픽스맵 저장 (좌표 변환용)
                     self.current_pixmap = pixmap
 
-                    # 큰 이미지 미리보기에 표시
-                    if hasattr(self, "large_image_preview"):
-                        # 큰 미리보기에는 더 큰 크기로 표시
+                    # 큰 이미지 미리보기에 표시 (같은 크기면 캐시 재사용)
+                    label_size = self.large_image_preview.size()
+                    cache_key = (
+                        template_id,
+                        label_size.width(),
+                        label_size.height(),
+                    )
+                    large_scaled_pixmap = self._scaled_cache.get(cache_key)
+                    if large_scaled_pixmap is None:
                         large_scaled_pixmap = pixmap.scaled(
-                            self.large_image_preview.size(),
+                            label_size,
                             Qt.AspectRatioMode.KeepAspectRatio,
                             Qt.TransformationMode.SmoothTransformation,
                         )
+                        self._scaled_cache[cache_key] = large_scaled_pixmap
+                    # setPixmap/setText를 한 번의 다시 그리기로 처리
+                    self.large_image_preview.setUpdatesEnabled(False)
+                    try:
                         self.large_image_preview.setPixmap(large_scaled_pixmap)
                         self.large_image_preview.setText("")
+                    finally:
+                        self.large_image_preview.setUpdatesEnabled(True)
 
+                    self._displayed_template_id = template_id
                     return
 
             # 이미지 로드 실패 시
-            if hasattr(self, "large_image_preview"):
-                self.large_image_preview.setText("이미지 로드 실패")
+            self.large_image_preview.setText("이미지 로드 실패")
 
         except Exception as e:
-            print(f"템플릿 이미지 로드 실패: {e}")
-            if hasattr(self, "large_image_preview"):
+            logger.warning(f"템플릿 이미지 로드 실패: {e}")
+            if self.large_image_preview is not None:
                 self.large_image_preview.setText("이미지 로드 오류")
 
     def on_mouse_capture_completed(self, point: QPoint):
@@ -1011,24 +1237,32 @@ class ActionEditor(QDialog):
 
             self.current_template_id = template_id
 
-            # 안전한 이미지 로드
-            QTimer.singleShot(0, lambda: self._safe_load_template_image(template_id))
+            # 안전한 이미지 로드 (다음 이벤트 루프에서 한 번에 처리)
+            self._queue_template_preview_refresh()
 
             # 로그 표시
-            print(f"액션 에디터에서 이미지 템플릿 설정됨: {template_name}")
+            logger.debug("액션 에디터에서 이미지 템플릿 설정됨: %s", template_name)
 
         except Exception as e:
-            print(f"캡쳐 완료 처리 중 오류: {e}")
+            logger.warning(f"캡쳐 완료 처리 중 오류: {e}")
 
     def _is_dialog_valid(self) -> bool:
-        """다이얼로그가 유효한지 확인"""
-        try:
-            # 기본 속성들에 접근해보기
-            _ = self.isVisible()
-            _ = self.parent()
-            return True
-        except (RuntimeError, AttributeError):
-            return False
+        """다이얼로그가 유효한지 확인 (C++ 객체가 삭제되지 않았는지)"""
+        return not sip.isdeleted(self)
+
+    def _queue_template_preview_refresh(self):
+        """미리보기 갱신을 큐에 등록 (레이아웃 반영 후 한 번만 실행)"""
+        QMetaObject.invokeMethod(
+            self, "_refresh_template_preview", Qt.ConnectionType.QueuedConnection
+        )
+
+    @pyqtSlot()
+    def _refresh_template_preview(self):
+        """템플릿 이미지 로드와 클릭 위치 복원을 한 번에 수행"""
+        if not self.current_template_id:
+            return
+        self._safe_load_template_image(self.current_template_id)
+        self._restore_click_position_after_type_change()
 
     def _safe_load_template_image(self, template_id: str):
         """안전한 템플릿 이미지 로드"""
@@ -1036,57 +1270,41 @@ class ActionEditor(QDialog):
             if self._is_dialog_valid():
                 self.load_template_image(template_id)
         except Exception as e:
-            print(f"안전한 이미지 로드 실패: {e}")
+            logger.warning(f"안전한 이미지 로드 실패: {e}")
 
     def get_selected_action_type(self) -> Optional[ActionType]:
         """선택된 액션 타입 반환"""
-
-        text = self.action_type_combo.currentText()
-        return STR_ACTION_MAP.get(text)
+        return self.action_type_combo.currentData()
 
     def get_selected_failure_action(self) -> ImageSearchFailureAction:
         """선택된 실패 처리 옵션 반환"""
-        failure_map = {
-            "실행 중단": ImageSearchFailureAction.STOP_EXECUTION,
-            "매크로 처음부터 재실행": ImageSearchFailureAction.RESTART_SEQUENCE,
-            "무시하고 다음 단계": ImageSearchFailureAction.SKIP_TO_NEXT,
-        }
-
-        if hasattr(self, "failure_action_combo"):
-            text = self.failure_action_combo.currentText()
-            return failure_map.get(text, ImageSearchFailureAction.STOP_EXECUTION)
+        if self.failure_action_combo is not None:
+            failure_action = self.failure_action_combo.currentData()
+            if failure_action is not None:
+                return failure_action
 
         return ImageSearchFailureAction.STOP_EXECUTION
 
     def get_selected_condition_type(self) -> ConditionType:
         """선택된 조건 타입 반환"""
-        condition_map = {
-            "이미지 발견": ConditionType.IMAGE_FOUND,
-            "이미지 미발견": ConditionType.IMAGE_NOT_FOUND,
-            "항상 실행": ConditionType.ALWAYS,
-        }
-
-        if hasattr(self, "condition_type_combo"):
-            text = self.condition_type_combo.currentText()
-            return condition_map.get(text, ConditionType.ALWAYS)
+        if self.condition_type_combo is not None:
+            condition_type = self.condition_type_combo.currentData()
+            if condition_type is not None:
+                return condition_type
 
         return ConditionType.ALWAYS
 
     def set_failure_action(self, failure_action: ImageSearchFailureAction):
         """실패 처리 옵션 설정"""
-        if not hasattr(self, "failure_action_combo"):
+        if self.failure_action_combo is None:
             return
 
-        failure_text_map = {
-            ImageSearchFailureAction.STOP_EXECUTION: "실행 중단",
-            ImageSearchFailureAction.RESTART_SEQUENCE: "매크로 처음부터 재실행",
-            ImageSearchFailureAction.SKIP_TO_NEXT: "무시하고 다음 단계",
-        }
-
-        text = failure_text_map.get(failure_action, "실행 중단")
-        index = self.failure_action_combo.findText(text)
-        if index >= 0:
-            self.failure_action_combo.setCurrentIndex(index)
+        self.failure_action_combo.setCurrentIndex(
+            FAILURE_INDEX_MAP.get(
+                failure_action,
+                FAILURE_INDEX_MAP[ImageSearchFailureAction.STOP_EXECUTION],
+            )
+        )
 
     def load_action_data(self, action: Optional[MacroAction]):
         """액션 데이터 로드 (편집 모드)"""
@@ -1095,175 +1313,174 @@ class ActionEditor(QDialog):
         title = "액션 편집" if self.is_edit_mode else "액션 추가"
         self.setWindowTitle(title)
 
-        if not self.action:
-            self.init_ui_values()
-        else:
-            type_text = ACTION_STR_MAP.get(self.action.action_type, "")
-            if type_text:
-                index = self.action_type_combo.findText(type_text)
-                if index >= 0:
-                    self.action_type_combo.setCurrentIndex(index)
+        # 편집 대상이 바뀌었으므로 모든 패널 값을 다시 로드하도록 초기화
+        self._loaded_panels.clear()
 
-        # UI 업데이트 (self.action이 설정된 상태에서 호출)
-        self.update_settings_ui()
+        # 여러 위젯을 연속으로 수정하므로 다시 그리기는 마지막에 한 번만 수행
+        self.setUpdatesEnabled(False)
+        try:
+            if not self.action:
+                self.init_ui_values()
+            else:
+                index = ACTION_TYPE_INDEX_MAP.get(self.action.action_type, -1)
+                if index >= 0:
+                    # 시그널을 막아 on_action_type_changed에서 중복 갱신되지 않도록 함
+                    with QSignalBlocker(self.action_type_combo):
+                        self.action_type_combo.setCurrentIndex(index)
+
+            # UI 업데이트 (self.action이 설정된 상태에서 한 번만 호출)
+            self.update_settings_ui()
+            self._load_template_state()
+
+            # 공통 설정 (활성화 상태, 설명)
+            self.enabled_check.setChecked(self.action.enabled if self.action else True)
+            self.description_input.setText(
+                (self.action.description or "") if self.action else ""
+            )
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def save_action(self):
         """액션 저장"""
         action_type = self.get_selected_action_type()
         if not action_type:
-            QMessageBox.warning(self, "경고", "액션 타입을 선택하세요.")
+            self._warn("액션 타입을 선택하세요.")
             return
 
         # 새 액션 생성 또는 기존 액션 업데이트
         if self.is_edit_mode:
             action = self.action
         else:
-            action = MacroAction(id=str(uuid.uuid4()), action_type=action_type)
+            action = MacroAction(id=uuid.uuid4().hex, action_type=action_type)
 
         action.action_type = action_type
-        action.enabled = (
-            self.enabled_check.isChecked() if hasattr(self, "enabled_check") else True
-        )
+        action.enabled = self.enabled_check.isChecked()
 
         # 설명 저장
-        if hasattr(self, "description_input"):
-            action.description = self.description_input.text().strip()
+        action.description = self.description_input.text().strip()
 
-        # 액션별 데이터 저장
-        if action_type == ActionType.CLICK:
-            # 좌표는 필수
-            if (
-                not hasattr(self, "selected_click_position")
-                or not self.selected_click_position
-            ):
-                QMessageBox.warning(self, "경고", "마우스 위치를 먼저 캡쳐하세요.")
-                return
+        # 액션별 데이터 저장 (선택된 타입의 패널은 항상 생성되어 있음)
+        save_handler = self._save_handlers.get(action_type)
+        if save_handler is not None and not save_handler(action):
+            return
 
-            action.click_position = self.selected_click_position
+        self.hide()
+        # 액션 저장 신호 발송
+        self.action_saved.emit(action)
 
-        elif action_type in [
-            ActionType.IMAGE_CLICK,
-        ]:
-            # 이미지 템플릿은 필수
-            if not hasattr(self, "current_template_id") or not self.current_template_id:
-                QMessageBox.warning(self, "경고", "먼저 이미지를 캡쳐하세요.")
-                return
+    def _warn(self, message: str):
+        """경고 메시지 표시"""
+        QMessageBox.warning(self, WARNING_TITLE, message)
 
-            # 클릭 위치도 필수
-            if (
-                not hasattr(self, "selected_click_position")
-                or not self.selected_click_position
-            ):
-                QMessageBox.warning(
-                    self, "경고", "이미지에서 클릭할 위치를 선택하세요."
-                )
-                return
+    def _save_click_action(self, action: MacroAction) -> bool:
+        """마우스 클릭 설정 저장"""
+        # 좌표는 필수
+        if not self.selected_click_position:
+            self._warn("마우스 위치를 먼저 캡쳐하세요.")
+            return False
 
-            action.image_template_id = self.current_template_id
-            action.click_position = self.selected_click_position
-            # 선택된 영역 정보 저장
-            if hasattr(self, "selected_region") and self.selected_region:
-                action.selected_region = self.selected_region
+        action.click_position = self.selected_click_position
+        return True
 
-            # 실패 처리 옵션 저장
-            action.on_image_not_found = self.get_selected_failure_action()
+    def _save_image_click_action(self, action: MacroAction) -> bool:
+        """이미지 클릭 설정 저장"""
+        # 이미지 템플릿은 필수
+        if not self.current_template_id:
+            self._warn(NO_IMAGE_WARNING)
+            return False
 
-        elif action_type == ActionType.TYPE_TEXT:
-            if hasattr(self, "text_input"):
-                text = self.text_input.toPlainText().strip()
-                if not text:
-                    QMessageBox.warning(self, "경고", "입력할 텍스트를 작성하세요.")
-                    return
-                action.text_input = text
+        # 클릭 위치도 필수
+        if not self.selected_click_position:
+            self._warn("이미지에서 클릭할 위치를 선택하세요.")
+            return False
 
-        elif action_type == ActionType.KEY_PRESS:
-            if hasattr(self, "key_input"):
-                # 캡처된 키가 있으면 그것을 사용
-                if hasattr(self, "captured_keys") and self.captured_keys:
-                    action.key_combination = self.captured_keys
-                else:
-                    # 텍스트 입력 방식으로 폴백
-                    key_text = self.key_input.text().strip()
-                    if not key_text:
-                        QMessageBox.warning(self, "경고", "키 조합을 입력하세요.")
-                        return
-                    action.key_combination = [k.strip() for k in key_text.split("+")]
+        action.image_template_id = self.current_template_id
+        action.click_position = self.selected_click_position
+        # 선택된 영역 정보 저장
+        if self.selected_region:
+            action.selected_region = self.selected_region
+
+        # 실패 처리 옵션 저장
+        action.on_image_not_found = self.get_selected_failure_action()
+        return True
+
+    def _save_text_action(self, action: MacroAction) -> bool:
+        """텍스트 입력 설정 저장"""
+        text = self.text_input.toPlainText().strip()
+        if not text:
+            self._warn("입력할 텍스트를 작성하세요.")
+            return False
 
-        elif action_type == ActionType.SCROLL:
-            # 스크롤 방향 저장
-            if hasattr(self, "scroll_direction_combo"):
-                direction_map = {
-                    "위쪽으로": "up",
-                    "아래쪽으로": "down",
-                    "왼쪽으로": "left",
-                    "오른쪽으로": "right",
-                }
-                direction_text = self.scroll_direction_combo.currentText()
-                action.scroll_direction = direction_map.get(direction_text, "down")
-
-            # 스크롤 픽셀 수 저장
-            if hasattr(self, "scroll_amount_spin"):
-                action.scroll_amount = self.scroll_amount_spin.value()
+        action.text_input = text
+        return True
 
-        elif action_type == ActionType.WAIT:
-            if hasattr(self, "wait_seconds"):
-                action.wait_seconds = self.wait_seconds.value()
+    def _save_key_action(self, action: MacroAction) -> bool:
+        """키 입력 설정 저장"""
+        # 캡처된 키가 있으면 그것을 사용
+        if self.captured_keys:
+            action.key_combination = self.captured_keys
+            return True
 
-        elif action_type == ActionType.SEND_TELEGRAM:
-            if hasattr(self, "telegram_message"):
-                message = self.telegram_message.toPlainText().strip()
-                if not message:
-                    QMessageBox.warning(self, "경고", "전송할 메시지를 작성하세요.")
-                    return
-                action.telegram_message = message
+        # 텍스트 입력 방식으로 폴백
+        key_text = self.key_input.text().strip()
+        if not key_text:
+            self._warn("키 조합을 입력하세요.")
+            return False
 
-        elif action_type == ActionType.IF:
-            # 조건 타입 저장
-            action.condition_type = self.get_selected_condition_type()
-
-            # 이미지 기반 조건인 경우 이미지 템플릿 필수
-            if action.condition_type in [
-                ConditionType.IMAGE_FOUND,
-                ConditionType.IMAGE_NOT_FOUND,
-            ]:
-                if (
-                    not hasattr(self, "current_template_id")
-                    or not self.current_template_id
-                ):
-                    QMessageBox.warning(
-                        self, "경고", "조건 확인에 사용할 이미지를 캡쳐하세요."
-                    )
-                    return
-                action.image_template_id = self.current_template_id
+        action.key_combination = [k.strip() for k in key_text.split("+")]
+        return True
+
+    def _save_scroll_action(self, action: MacroAction) -> bool:
+        """스크롤 설정 저장"""
+        action.scroll_direction = self.scroll_direction_combo.currentData() or "down"
+        action.scroll_amount = self.scroll_amount_spin.value()
+        return True
+
+    def _save_wait_action(self, action: MacroAction) -> bool:
+        """대기 설정 저장"""
+        action.wait_seconds = self.wait_seconds.value()
+        return True
+
+    def _save_telegram_action(self, action: MacroAction) -> bool:
+        """텔레그램 전송 설정 저장"""
+        message = self.telegram_message.toPlainText().strip()
+        if not message:
+            self._warn("전송할 메시지를 작성하세요.")
+            return False
 
-        elif action_type == ActionType.ELSE:
-            # ELSE는 별도 설정이 필요 없음
-            pass
+        action.telegram_message = message
+        return True
 
-        self.hide()
-        # 액션 저장 신호 발송
-        self.action_saved.emit(action)
+    def _save_if_action(self, action: MacroAction) -> bool:
+        """조건문(IF) 설정 저장"""
+        action.condition_type = self.get_selected_condition_type()
+
+        # 이미지 기반 조건인 경우 이미지 템플릿 필수
+        if action.condition_type in IMAGE_CONDITION_TYPES:
+            if not self.current_template_id:
+                self._warn("조건 확인에 사용할 이미지를 캡쳐하세요.")
+                return False
+            action.image_template_id = self.current_template_id
+        return True
 
     def _restore_click_position_after_type_change(self):
         """액션 타입 변경 후 클릭 위치 복원"""
         try:
-            if (
-                hasattr(self, "selected_click_position")
-                and self.selected_click_position
-            ):
+            if self.selected_click_position:
                 # 좌표 스핀박스에 값 설정
-                if hasattr(self, "click_x_spin") and self.click_x_spin:
+                if self.click_x_spin is not None:
                     self.click_x_spin.setValue(self.selected_click_position[0])
-                if hasattr(self, "click_y_spin") and self.click_y_spin:
+                if self.click_y_spin is not None:
                     self.click_y_spin.setValue(self.selected_click_position[1])
 
                 # 클릭 위치 마커 업데이트
                 self.update_large_click_position_marker()
 
                 # 클릭 위치 정보 업데이트
-                if hasattr(self, "click_info_label"):
+                if self.click_info_label is not None:
                     x, y = self.selected_click_position
                     self.click_info_label.setText(f"클릭 위치: ({x}, {y})")
 
         except Exception as e:
-            print(f"클릭 위치 복원 실패: {e}")
+            logger.warning(f"클릭 위치 복원 실패: {e}")
@@ -89,9 +89,13 @@ class MousePositionOverlay(QWidget):
         # 포커스 설정
         self.setFocus(Qt.FocusReason.OtherFocusReason)
 
-        # 입력 캡처 설정을 지연 실행
-        QTimer.singleShot(100, self._force_focus)
-        QTimer.singleShot(150, self._setup_input_capture)
+        # 포커스 재설정과 입력 캡처 설정을 한 번의 지연 실행으로 처리
+        QTimer.singleShot(100, self._activate_input)
+
+    def _activate_input(self):
+        """강제 포커스 설정 후 입력 장치 캡처"""
+        self._force_focus()
+        self._setup_input_capture()
 
     def _force_focus(self):
         """강제 포커스 설정"""
@@ -316,9 +320,8 @@ class ScreenOverlay(QWidget):
         # 포커스 설정 (여러 번 시도)
         self.setFocus(Qt.FocusReason.OtherFocusReason)
 
-        # 좀 더 강력한 포커스 설정과 마우스 그랩을 지연 실행
-        QTimer.singleShot(100, self._force_focus)
-        QTimer.singleShot(150, self._setup_input_capture)
+        # 좀 더 강력한 포커스 설정과 마우스 그랩을 한 번의 지연 실행으로 처리
+        QTimer.singleShot(100, self._activate_input)
 
         print(f"[DEBUG] ScreenOverlay: After show - geometry: {self.geometry()}")
         print(f"[DEBUG] ScreenOverlay: window flags = {self.windowFlags()}")
@@ -326,6 +329,11 @@ class ScreenOverlay(QWidget):
         print(f"[DEBUG] ScreenOverlay: has focus = {self.hasFocus()}")
         print(f"[DEBUG] ScreenOverlay: is active = {self.isActiveWindow()}")
 
+    def _activate_input(self):
+        """강제 포커스 설정 후 입력 장치 캡처"""
+        self._force_focus()
+        self._setup_input_capture()
+
     def _force_focus(self):
         """강제 포커스 설정"""
         self.raise_()
@@ -31,7 +31,6 @@ from PyQt6.QtGui import (
 )
 
 from pynput import keyboard
-from threading import Thread
 
 from macro.core.macro_engine import MacroEngine, MacroExecutionResult
 from macro.models.macro_models import ActionType
@@ -39,6 +38,9 @@ from macro.ui.telegram_settings import TelegramSettingsDialog
 from macro.ui.action_editor import ActionEditor
 from macro.ui.capture_dialog import MacroStatusOverlay
 
+# 시퀀스 구조를 이루는 조건문 액션 타입 (테이블에서 배경색으로 구분)
+CONDITION_BLOCK_ACTION_TYPES = frozenset({ActionType.IF, ActionType.ELSE})
+
 
 class HotkeySignal(QObject):
     """Hotkey 이벤트 처리를 위한 signal 클래스"""
@@ -81,6 +83,8 @@ class MainWindow(QMainWindow):
 
         # Hotkey signal 객체
         self.hotkey_signal = HotkeySignal()
+        # 글로벌 핫키 리스너 (pynput 자체 데몬 스레드에서 동작)
+        self.hotkey_listener: Optional[keyboard.Listener] = None
 
         # UI 초기화
         self.init_ui()
@@ -127,27 +131,25 @@ class MainWindow(QMainWindow):
         # 실행 메뉴
         run_menu = menubar.addMenu("실행 & 중지")
 
-        def hotkey_listener():
-            def on_press(key):
-                try:
-                    if key == keyboard.Key.f10:
-                        # 메인 스레드로 signal 전송 (스레드 안전)
-                        self.hotkey_signal.run_macro_requested.emit()
-                    elif key == keyboard.Key.f11:
-                        # 메인 스레드로 signal 전송 (스레드 안전)
-                        self.hotkey_signal.stop_macro_requested.emit()
-                except Exception as e:
-                    print(f"Hotkey 처리 중 오류: {e}")
-
+        def on_press(key):
             try:
-                with keyboard.Listener(on_press=on_press) as listener:
-                    listener.join()
+                if key == keyboard.Key.f10:
+                    # 메인 스레드로 signal 전송 (스레드 안전)
+                    self.hotkey_signal.run_macro_requested.emit()
+                elif key == keyboard.Key.f11:
+                    # 메인 스레드로 signal 전송 (스레드 안전)
+                    self.hotkey_signal.stop_macro_requested.emit()
             except Exception as e:
-                print(f"Keyboard listener 오류: {e}")
+                print(f"Hotkey 처리 중 오류: {e}")
 
-        t = Thread(target=hotkey_listener,daemon=True)
-        t.start()
-        print("hotkey listener started")
+        # Listener는 자체 데몬 스레드이므로 별도 스레드로 감싸거나 join하지 않음
+        try:
+            self.hotkey_listener = keyboard.Listener(on_press=on_press)
+            self.hotkey_listener.start()
+            print("hotkey listener started")
+        except Exception as e:
+            self.hotkey_listener = None
+            print(f"Keyboard listener 오류: {e}")
 
         self.run_action = QAction("매크로 실행(F10)", self)
         self.run_action.triggered.connect(self.run_main_sequence)
@@ -412,45 +414,9 @@ class MainWindow(QMainWindow):
             print(f"데이터 로드 실패: {e}")
             self.add_log(f"데이터 로드 실패: {e}")
 
-    def refresh_action_table(self):
-        """액션 테이블 새로고침"""
-        self.action_table.setRowCount(0)
-
-        sequence = self.engine.config.macro_sequence
-        self.action_table.setRowCount(len(sequence.actions))
-
-        # 인덴트 레벨 계산
-        indent_levels = self.calculate_action_indents(sequence.actions)
-
-        for i, action in enumerate(sequence.actions):
-            indent_level = indent_levels[i] if i < len(indent_levels) else 0
-
-            # 타입 (인덴트 적용)
-            type_display = self.get_action_display_name(action, indent_level)
-            type_item = QTableWidgetItem(type_display)
-            # 구조적 요소들에 배경색 적용
-            if action.action_type in [ActionType.IF, ActionType.ELSE]:
-                type_item.setBackground(Qt.GlobalColor.lightGray)
-            self.action_table.setItem(i, 0, type_item)
-
-            # 설명 (기본 설명)
-            description = action.description or "-"
-            desc_item = QTableWidgetItem(description)
-            self.action_table.setItem(i, 1, desc_item)
-
-            # 활성화 체크박스
-            enabled_checkbox = QCheckBox()
-            enabled_checkbox.setChecked(action.enabled)
-            enabled_checkbox.toggled.connect(
-                lambda checked, aid=action.id: self.toggle_action_enabled(aid, checked)
-            )
-            self.action_table.setCellWidget(i, 2, enabled_checkbox)
-
     def get_action_description(self, action) -> str:
         """액션 설명 생성"""
-        if action.action_type in [
-            ActionType.IMAGE_CLICK,
-        ]:
+        if action.action_type == ActionType.IMAGE_CLICK:
             if action.click_position:
                 return f"위치 ({action.click_position[0]}, {action.click_position[1]})"
             else:
@@ -804,7 +770,8 @@ class MainWindow(QMainWindow):
 
             # 파일 저장
             screenshot_dir = Path(self.engine.config.screenshot_save_path)
-            screenshot_dir.mkdir(parents=True, exist_ok=True)
+            if not screenshot_dir.is_dir():
+                screenshot_dir.mkdir(parents=True, exist_ok=True)
 
             file_name = f"{template_name}.png"
             file_path = screenshot_dir / file_name
@@ -939,7 +906,7 @@ class MainWindow(QMainWindow):
             sequence = self.engine.config.macro_sequence
             for row in selected_rows:
                 new_action = copy.deepcopy(sequence.actions[row])
-                new_action.id = str(uuid.uuid4())
+                new_action.id = uuid.uuid4().hex
                 sequence.add_action(new_action)
                 sequence.move_action(new_action.id, row + 1)
             self.engine.save_config()
@@ -1098,17 +1065,16 @@ class MainWindow(QMainWindow):
             }
 
             for i, action in enumerate(actions):
-                # 순서
-                from PyQt6.QtWidgets import QTableWidgetItem
-                from PyQt6.QtCore import Qt
-
                 # 타입
                 type_text = type_map.get(action.action_type, action.action_type.value)
                 type_item = QTableWidgetItem(type_text)
+                # 구조적 요소들에 배경색 적용
+                if action.action_type in CONDITION_BLOCK_ACTION_TYPES:
+                    type_item.setBackground(Qt.GlobalColor.lightGray)
                 self.action_table.setItem(i, 0, type_item)
 
                 # 설명
-                description = getattr(action, "description", "") or ""
+                description = action.description or ""
                 description_item = QTableWidgetItem(description)
                 self.action_table.setItem(i, 1, description_item)
 
@@ -1413,8 +1379,9 @@ class MainWindow(QMainWindow):
             self.add_log("애플리케이션 종료됨")
 
             # 글로벌 핫키 리스너 정리
-            if hasattr(self, "hotkey_manager") and self.hotkey_manager:
-                self.hotkey_manager.stop_listening()
+            if self.hotkey_listener:
+                self.hotkey_listener.stop()
+                self.hotkey_listener = None
                 print("Global hotkey listener stopped on application exit")
 
         except Exception as e: